@@ -21,7 +21,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import signal
 import sys
 import threading
-from http.server import HTTPServer
+from http.server import ThreadingHTTPServer
 
 from .manager import ProcessManager
 from .web_handler import WebHandler
@@ -41,7 +41,7 @@ def main():
     monitor_thread = threading.Thread(target=manager.monitor_processes, daemon=True)
     monitor_thread.start()
 
-    server = HTTPServer((manager.web_host, manager.web_port), WebHandler)
+    server = ThreadingHTTPServer((manager.web_host, manager.web_port), WebHandler)
     print(f"Process Manager started")
     print(f"Web UI available at http://{manager.web_host}:{manager.web_port}")
     print("Press Ctrl+C to stop")
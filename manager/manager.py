@@ -12,33 +12,67 @@ the Free Software Foundation, either version 3 of the License, or
 import subprocess
 import threading
 import time
+import select
 import signal
 import sys
 import os
 import re
 import shutil
-import zipfile
-import tempfile
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+import hashlib
 import json
 import yaml
 
+# Prefer the libyaml C extension when available - much faster than the
+# pure-Python parser, with identical safe-loading semantics
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 from .models import ProcessInfo, RUNTIME_PYTHON, RUNTIME_NODE, RUNTIME_EXEC, SUPPORTED_RUNTIMES
 
+
+# Prefer orjson's C serializer when installed - identical output for the
+# plain dict/list payloads produced here, several times faster to encode
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+IS_WINDOWS = sys.platform == "win32"
+IS_LINUX = sys.platform.startswith("linux")
+
+# On Linux, CPU usage comes from /proc/<pid>/stat directly (persistent fd,
+# one read + one split per sample); psutil is only needed elsewhere
+PROC_STAT_AVAILABLE = IS_LINUX and os.path.exists("/proc/self/stat")
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
 try:
     import psutil
     PSUTIL_AVAILABLE = True
 except ImportError:
     PSUTIL_AVAILABLE = False
-    print("Warning: psutil not installed, CPU monitoring disabled")
-
-IS_WINDOWS = sys.platform == "win32"
+    if not PROC_STAT_AVAILABLE:
+        print("Warning: psutil not installed, CPU monitoring disabled")
 
 # Constants for uploaded programs
 UPLOADED_PROGRAMS_DIR = "uploaded_programs"
 MAX_UPLOAD_SIZE_MB = 50
 
+# Precompiled patterns for sanitize_filename
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+_COLLAPSE_RE = re.compile(r'_+')
+
 
 class ProcessManager:
     def __init__(self, config_path: str = "manager.yaml"):
@@ -55,14 +89,40 @@ class ProcessManager:
         self.venv_python = None  # Will be set in load_config()
         self.node_path = None  # Will be set in load_config()
         self.global_cwd = None  # Will be set in load_config()
+        self._yaml_cache = {}  # path -> ((mtime_ns, size), parsed dict)
+        self._log_size_cache = {}  # log file name -> size in bytes, refreshed each monitor tick
+        self._log_line_cache = {}  # log path -> (size, newline count, last byte)
+        self._status_cache = (0.0, b"", "")  # (timestamp, json bytes, etag) for /api/status
+        self._last_status_request = time.monotonic()  # CPU sampling pauses when nobody polls
+
+        # Wakes the monitor immediately when a child exits (set by SIGCHLD)
+        self._child_exited = threading.Event()
+        # PID-file writes are requested via this flag and coalesced by a
+        # background writer thread (see _pid_writer_loop)
+        self._pids_dirty = threading.Event()
+        if not IS_WINDOWS and threading.current_thread() is threading.main_thread():
+            try:
+                signal.signal(signal.SIGCHLD, self._on_sigchld)
+            except (ValueError, OSError):
+                pass
 
         # Create uploaded programs directory if it doesn't exist
         self.uploaded_dir.mkdir(exist_ok=True)
+        # Shared pip wheel/HTTP cache so uploads don't re-download the
+        # same packages for every program
+        self.pip_cache_dir = self.uploaded_dir / ".pip-cache"
+        self.pip_cache_dir.mkdir(exist_ok=True)
+        # Finished venvs cached by requirements.txt hash; identical
+        # dependency sets are copied instead of resolved again
+        self.venv_template_dir = self.uploaded_dir / ".venv-templates"
+        self.venv_template_dir.mkdir(exist_ok=True)
         # Create log directory if it doesn't exist
         self.log_dir.mkdir(exist_ok=True)
 
         self.load_config()
         self.restore_processes()
+        self._log_size_cache = self._scan_log_sizes()
+        threading.Thread(target=self._pid_writer_loop, daemon=True).start()
 
     def reload_config(self) -> dict:
         """Reload configuration from disk without restarting processes.
@@ -76,10 +136,22 @@ class ProcessManager:
             except Exception as e:
                 return {"success": False, "message": f"Failed to reload configuration: {str(e)}"}
 
+    def _load_yaml_cached(self, path: Path):
+        """Load a YAML file, reusing the previously parsed result when the
+        file on disk is unchanged (keyed on mtime and size)."""
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._yaml_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        with open(path) as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+        self._yaml_cache[path] = (key, data)
+        return data
+
     def load_config(self):
         # Load main configuration (settings only)
-        with open(self.config_path) as f:
-            self.config = yaml.safe_load(f)
+        self.config = self._load_yaml_cached(self.config_path)
 
         self.restart_delay = self.config.get("restart", {}).get("delay_seconds", 1)
         self.max_failures = self.config.get("restart", {}).get("max_consecutive_failures", 10)
@@ -129,54 +201,49 @@ class ProcessManager:
 
         # Load programs from progs.yaml
         if self.programs_config_path.exists():
-            with open(self.programs_config_path) as f:
-                programs_config = yaml.safe_load(f) or {}
+            programs_config = self._load_yaml_cached(self.programs_config_path) or {}
         else:
             programs_config = {"programs": []}
 
         # Load all programs from progs.yaml
         for prog in programs_config.get("programs", []):
             name = prog["name"]
-            program_type = prog.get("type", RUNTIME_PYTHON)
-            program_uploaded = prog.get("uploaded", False)
-            program_venv = prog.get("venv")
-            program_cwd = prog.get("cwd")
-            program_args = prog.get("args")
-            program_environment = prog.get("environment")
-            program_comment = prog.get("comment")
-            program_module = prog.get("module")  # Python module for -m execution
-            # Ensure args is a list
-            if program_args is not None and not isinstance(program_args, list):
-                program_args = [str(program_args)]
-            # Ensure environment is a list
-            if program_environment is not None and not isinstance(program_environment, list):
-                program_environment = [str(program_environment)]
-            if name not in self.processes:
-                self.processes[name] = ProcessInfo(
-                    name=name,
-                    script=prog.get("script"),
-                    module=program_module,
-                    type=program_type,
-                    enabled=prog.get("enabled", True),
-                    uploaded=program_uploaded,
-                    comment=program_comment,
-                    venv=program_venv,
-                    cwd=program_cwd,
-                    args=program_args,
-                    environment=program_environment
-                )
+            fields = self._normalize_program(prog)
+            info = self.processes.get(name)
+            if info is None:
+                self.processes[name] = info = ProcessInfo(name=name, **fields)
+                self._assign_log_paths(info)
             else:
                 # Update existing process (on reload)
-                self.processes[name].script = prog.get("script")
-                self.processes[name].module = program_module
-                self.processes[name].type = program_type
-                self.processes[name].enabled = prog.get("enabled", True)
-                self.processes[name].uploaded = program_uploaded
-                self.processes[name].comment = program_comment
-                self.processes[name].venv = program_venv
-                self.processes[name].cwd = program_cwd
-                self.processes[name].args = program_args
-                self.processes[name].environment = program_environment
+                for key, value in fields.items():
+                    setattr(info, key, value)
+                info._static_status = None
+                info._launch_plan = None
+
+    @staticmethod
+    def _normalize_program(prog: dict) -> dict:
+        """Normalize one progs.yaml entry into ProcessInfo field values.
+
+        Shared by the create and reload-update paths so the coercion
+        rules live in one place."""
+        args = prog.get("args")
+        if args is not None and not isinstance(args, list):
+            args = [str(args)]
+        environment = prog.get("environment")
+        if environment is not None and not isinstance(environment, list):
+            environment = [str(environment)]
+        return {
+            "script": prog.get("script"),
+            "module": prog.get("module"),  # Python module for -m execution
+            "type": prog.get("type", RUNTIME_PYTHON),
+            "enabled": prog.get("enabled", True),
+            "uploaded": prog.get("uploaded", False),
+            "comment": prog.get("comment"),
+            "venv": prog.get("venv"),
+            "cwd": prog.get("cwd"),
+            "args": args,
+            "environment": environment,
+        }
 
     def save_programs(self):
         """Save all programs to progs.yaml."""
@@ -208,29 +275,56 @@ class ProcessManager:
                     prog["environment"] = info.environment
                 programs_config.append(prog)
 
+        # Write to a temp file and rename into place so a crash mid-dump
+        # can never leave a truncated progs.yaml behind
+        tmp_file = self.programs_config_path.with_suffix(".tmp")
         try:
-            with open(self.programs_config_path, "w") as f:
-                yaml.dump({"programs": programs_config}, f, default_flow_style=False, sort_keys=False)
+            with open(tmp_file, "w") as f:
+                yaml.dump({"programs": programs_config}, f, Dumper=_YamlDumper,
+                          default_flow_style=False, sort_keys=False)
+            os.replace(tmp_file, self.programs_config_path)
         except Exception as e:
             print(f"Failed to save programs: {e}")
             raise
 
     def save_pids(self):
-        """Save current process PIDs to file for persistence."""
+        """Request a PID-file write.
+
+        Writes are coalesced by the background writer thread, so a burst
+        of changes (e.g. every program starting at boot) costs a single
+        rewrite instead of one per process."""
+        self._pids_dirty.set()
+
+    def _write_pids_now(self):
+        """Serialize live-process state and atomically replace the PID file."""
         data = {}
-        for name, info in self.processes.items():
-            if info.pid and self.is_process_alive(info.pid):
-                data[name] = {
-                    "pid": info.pid,
-                    "start_time": info.start_time.isoformat() if info.start_time else None,
-                    "total_restarts": info.total_restarts
-                }
+        with self.lock:
+            for name, info in self.processes.items():
+                # Trust the monitor's view of liveness (it just polled) -
+                # no need for a kill(pid, 0) per process per write
+                if info.pid and info.status in ("running", "restarting"):
+                    data[name] = {
+                        "pid": info.pid,
+                        "start_time": info.start_time.isoformat() if info.start_time else None,
+                        "total_restarts": info.total_restarts
+                    }
+        tmp_file = self.pid_file.with_suffix(".tmp")
         try:
-            with open(self.pid_file, "w") as f:
+            with open(tmp_file, "w") as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp_file, self.pid_file)  # Atomic - no torn reads on crash
         except Exception as e:
             print(f"Failed to save PID file: {e}")
 
+    def _pid_writer_loop(self):
+        """Background thread: debounce dirty flags into actual writes."""
+        while self.running:
+            if not self._pids_dirty.wait(timeout=1):
+                continue
+            time.sleep(0.5)  # Let a burst of state changes settle
+            self._pids_dirty.clear()
+            self._write_pids_now()
+
     def restore_processes(self):
         """Restore process state from PID file and check if processes are still alive."""
         if not self.pid_file.exists():
@@ -251,6 +345,7 @@ class ProcessManager:
             if pid and self.is_process_alive(pid):
                 info = self.processes[name]
                 info.pid = pid
+                self._open_pidfd(info)
                 info.status = "running"
                 info.enabled = True  # Enable monitoring for restored running processes
                 if saved.get("start_time"):
@@ -260,6 +355,9 @@ class ProcessManager:
                         info.start_time = datetime.now()
                 else:
                     info.start_time = datetime.now()
+                # Anchor the monotonic start so uptime carries over the restore
+                elapsed = max(0.0, (datetime.now() - info.start_time).total_seconds())
+                info._start_monotonic = time.monotonic() - elapsed
                 info.total_restarts = saved.get("total_restarts", 0)
                 print(f"[{name}] Restored running process with PID {pid}")
             else:
@@ -268,16 +366,77 @@ class ProcessManager:
     def sanitize_filename(self, name: str) -> str:
         """Sanitize a name for use in filenames - replace spaces and special chars with underscore."""
         # Replace spaces and non-alphanumeric chars (except - and _) with underscore
-        sanitized = re.sub(r'[^a-zA-Z0-9_-]', '_', name)
+        sanitized = _SANITIZE_RE.sub('_', name)
         # Collapse multiple underscores
-        sanitized = re.sub(r'_+', '_', sanitized)
+        sanitized = _COLLAPSE_RE.sub('_', sanitized)
         # Remove leading/trailing underscores
         return sanitized.strip('_')
 
+    def _assign_log_paths(self, info: ProcessInfo):
+        """Precompute name-derived log paths on a ProcessInfo.
+
+        These are constant until the program is renamed, so hot paths
+        (monitor tick, status, log API) can skip the regex work."""
+        info._sanitized_name = self.sanitize_filename(info.name)
+        info._log_path = self.log_dir / f"{info._sanitized_name}.log"
+        info._backup_log_path = self.log_dir / f"{info._sanitized_name}.log.1"
+
+    def _open_pidfd(self, info: ProcessInfo):
+        """Attach a pidfd to a restored process when the platform has one.
+
+        A pidfd refers to the process itself, not the PID number, so
+        liveness checks through it cannot be fooled by PID reuse. Spawned
+        processes don't need this - their Popen object already tracks the
+        real child."""
+        if info.pid is None or not hasattr(os, "pidfd_open"):
+            return
+        try:
+            info._pidfd = os.pidfd_open(info.pid)
+        except OSError:
+            info._pidfd = None
+
+    def _close_pidfd(self, info: ProcessInfo):
+        """Release the per-process fds (pidfd, stat fd) when it goes away."""
+        if info._pidfd is not None:
+            try:
+                os.close(info._pidfd)
+            except OSError:
+                pass
+            info._pidfd = None
+        self._close_stat_fd(info)
+
+    def _restored_alive(self, info: ProcessInfo) -> bool:
+        """Liveness check for a restored process (no Popen object).
+
+        A pidfd becomes readable exactly when the process exits, so a
+        zero-timeout select answers without touching /proc and without
+        any PID-reuse race."""
+        if info._pidfd is not None:
+            readable, _, _ = select.select([info._pidfd], [], [], 0)
+            return not readable
+        return self.is_process_alive(info.pid)
+
+    def _liveness(self, info: ProcessInfo) -> bool:
+        """Liveness for a managed process, cheapest source first.
+
+        An owned Popen answers via poll() (reaps and reports external
+        kills, no extra syscall when the child already exited); restored
+        processes fall back to pidfd/PID checks."""
+        if info.process is not None:
+            return info.process.poll() is None
+        if info.pid is not None:
+            return self._restored_alive(info)
+        return False
+
     def is_process_alive(self, pid: int) -> bool:
         """Check if a process with the given PID is still alive."""
         if pid is None:
             return False
+        # Fast path on Linux: checking for the /proc entry is a cheap
+        # dentry lookup, avoiding the kill(0) syscall and psutil dispatch.
+        # This is called several times per process per second by the monitor.
+        if IS_LINUX:
+            return os.path.exists(f"/proc/{pid}")
         try:
             # Prefer psutil if available - more reliable across platforms
             if PSUTIL_AVAILABLE:
@@ -316,15 +475,68 @@ class ProcessManager:
             # Use global venv
             return self.venv_python
 
-    def collect_cpu_usage(self, info: ProcessInfo):
-        """Collect CPU usage for a process and add to history."""
-        if not PSUTIL_AVAILABLE:
+    @staticmethod
+    def _close_stat_fd(info: ProcessInfo):
+        """Release the cached /proc stat fd and its sample state."""
+        if info._stat_fd is not None:
+            try:
+                os.close(info._stat_fd)
+            except OSError:
+                pass
+        info._stat_fd = None
+        info._stat_fd_pid = None
+        info._stat_prev = None
+
+    def _collect_cpu_proc(self, info: ProcessInfo, pid: int):
+        """CPU sample via a persistent /proc/<pid>/stat fd (Linux).
+
+        One lseek+read+split per sample instead of psutil's re-open and
+        full-table parse. The fd stays bound to the original process, so
+        a reused PID just makes the read fail rather than sampling the
+        wrong process.
+
+        Sampling runs outside the manager lock while stop/restart
+        workers may concurrently clear the fd via _close_stat_fd, so
+        work on a local copy of it and treat garbage from a racily
+        reused fd number like a failed read."""
+        fd = info._stat_fd
+        try:
+            if fd is None or info._stat_fd_pid != pid:
+                self._close_stat_fd(info)
+                fd = info._stat_fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+                info._stat_fd_pid = pid
+            os.lseek(fd, 0, os.SEEK_SET)
+            buf = os.read(fd, 512)
+            # Fields after the parenthesized comm: state is field 3, so
+            # utime/stime (fields 14/15) land at split indices 11/12
+            fields = buf[buf.rindex(b")") + 2:].split()
+            jiffies = int(fields[11]) + int(fields[12])
+        except (OSError, ValueError, IndexError):
+            self._close_stat_fd(info)
+            info.append_cpu_sample(0.0)
+            return
+        now = time.monotonic()
+        prev = info._stat_prev
+        info._stat_prev = (jiffies, now)
+        if prev is None or now <= prev[1]:
+            info.append_cpu_sample(0.0)
             return
+        cpu_percent = (jiffies - prev[0]) / _CLK_TCK / (now - prev[1]) * 100.0
+        info.append_cpu_sample(round(cpu_percent, 1))
 
+    def collect_cpu_usage(self, info: ProcessInfo):
+        """Collect CPU usage for a process and add to history."""
         pid = info.pid
-        if not pid or not self.is_process_alive(pid):
+        if not pid:
             info._psutil_process = None
-            info.cpu_history.append(0.0)
+            self._close_stat_fd(info)
+            info.append_cpu_sample(0.0)
+            return
+
+        if PROC_STAT_AVAILABLE:
+            self._collect_cpu_proc(info, pid)
+            return
+        if not PSUTIL_AVAILABLE:
             return
 
         try:
@@ -332,12 +544,72 @@ class ProcessManager:
             if info._psutil_process is None or info._psutil_process.pid != pid:
                 info._psutil_process = psutil.Process(pid)
 
-            # Get CPU percent (since last call, non-blocking)
-            cpu_percent = info._psutil_process.cpu_percent(interval=None)
-            info.cpu_history.append(cpu_percent)
+            # Get CPU percent (since last call, non-blocking); oneshot()
+            # batches the underlying /proc reads for the sample
+            with info._psutil_process.oneshot():
+                cpu_percent = info._psutil_process.cpu_percent(interval=None)
+            # Round once at insertion so readers can serialize the history as-is
+            info.append_cpu_sample(round(cpu_percent, 1))
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            # NoSuchProcess doubles as the liveness check - no separate
+            # kill(pid, 0) precheck needed per sample
             info._psutil_process = None
-            info.cpu_history.append(0.0)
+            info.append_cpu_sample(0.0)
+
+    def _scan_log_sizes(self) -> dict:
+        """Collect the sizes of all log files with a single directory scan.
+
+        One scandir pass replaces per-process stat calls; the result is
+        shared by rotation checks and get_status.
+        """
+        sizes = {}
+        try:
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".log"):
+                        try:
+                            sizes[entry.name] = entry.stat().st_size
+                        except OSError:
+                            pass
+        except OSError:
+            pass
+        return sizes
+
+    @staticmethod
+    def _copy_and_truncate_log(src: Path, dst: Path):
+        """Copy a log file's data to dst, then truncate src through the
+        same open fd.
+
+        Uses os.copy_file_range / os.sendfile where the OS offers them,
+        so the bytes move inside the kernel instead of through Python
+        buffers; falls back to shutil.copyfileobj elsewhere. Truncating
+        via ftruncate on the fd we copied from (rather than re-opening
+        the path) saves an open and closes the window where the log
+        could be swapped out between copy and truncate."""
+        with open(src, "r+b") as fsrc, open(dst, "wb") as fdst:
+            sfd, dfd = fsrc.fileno(), fdst.fileno()
+            copied = False
+            if hasattr(os, "copy_file_range") or hasattr(os, "sendfile"):
+                try:
+                    remaining = os.fstat(sfd).st_size
+                    offset = 0
+                    while remaining > 0:
+                        if hasattr(os, "copy_file_range"):
+                            moved = os.copy_file_range(sfd, dfd, remaining)
+                        else:
+                            moved = os.sendfile(dfd, sfd, offset, remaining)
+                            offset += moved
+                        if moved == 0:
+                            break
+                        remaining -= moved
+                    copied = True
+                except OSError:
+                    fsrc.seek(0)
+                    fdst.seek(0)
+                    fdst.truncate()
+            if not copied:
+                shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+            os.ftruncate(sfd, 0)
 
     def rotate_log_if_needed(self, info: ProcessInfo):
         """Check log file size and rotate if needed using copytruncate method.
@@ -345,39 +617,37 @@ class ProcessManager:
         This copies the log to .log.1 and truncates the original file.
         The subprocess keeps writing to the same fd, now at position 0.
         """
-        log_file = self.log_dir / f"{self.sanitize_filename(info.name)}.log"
-        if not log_file.exists():
+        log_file = info._log_path
+        size_bytes = self._log_size_cache.get(log_file.name)
+        if size_bytes is None:
             return
 
         try:
-            size_bytes = log_file.stat().st_size
             size_mb = size_bytes / (1024 * 1024)
 
             if size_mb < self.max_log_size_mb:
                 return
 
             # Rotate: copy to .log.1 then truncate original
-            backup_file = self.log_dir / f"{self.sanitize_filename(info.name)}.log.1"
+            backup_file = info._backup_log_path
 
-            # Copy current log to backup (overwrites existing backup)
-            shutil.copy2(log_file, backup_file)
-
-            # Truncate the original file in place (keeps same inode/fd)
-            os.truncate(log_file, 0)
+            # Copy current log to backup (overwrites existing backup),
+            # then truncate the original in place (keeps same inode/fd)
+            self._copy_and_truncate_log(log_file, backup_file)
+            self._log_line_cache.pop(log_file, None)  # Counter restarts from the empty file
 
             print(f"[{info.name}] Log rotated: {size_mb:.1f}MB -> {backup_file.name}")
         except Exception as e:
             print(f"[{info.name}] Failed to rotate log: {e}")
 
-    def start_process(self, info: ProcessInfo):
-        if info.is_broken:
-            print(f"[{info.name}] Marked as broken, not starting")
-            return
-
-        if not info.enabled:
-            print(f"[{info.name}] Disabled, not starting")
-            return
+    def _build_launch_plan(self, info: ProcessInfo) -> tuple:
+        """Resolve (work_dir, script_path, cmd, env_overrides) for a program.
 
+        All the Path arithmetic and venv resolution happens here once;
+        the result is cached on the ProcessInfo and reused across
+        restarts until the program is edited or the config reloaded.
+        Returns None (after printing the reason) if the config is
+        incomplete. script_path is None for module-mode programs."""
         # Determine working directory: program cwd > global cwd > base_dir
         if info.cwd:
             cwd_path = Path(info.cwd)
@@ -389,36 +659,24 @@ class ProcessManager:
         else:
             work_dir = self.base_dir
 
-        log_file = self.log_dir / f"{self.sanitize_filename(info.name)}.log"
-
         # Build command based on runtime type
+        script_path = None
         if info.type == RUNTIME_EXEC:
             # Plain executable - requires script
             if not info.script:
                 print(f"[{info.name}] No script specified for executable")
-                info.status = "error"
-                return
+                return None
             script_path = work_dir / info.script
-            if not script_path.exists():
-                print(f"[{info.name}] Script not found: {script_path}")
-                info.status = "error"
-                return
             cmd = [str(script_path)]
         elif info.type == RUNTIME_NODE:
             # Node.js program - requires script
             if not info.script:
                 print(f"[{info.name}] No script specified for Node.js program")
-                info.status = "error"
-                return
+                return None
             if not self.node_path:
                 print(f"[{info.name}] Node.js not found. Install Node.js or configure 'node' in {self.config_path}")
-                info.status = "error"
-                return
+                return None
             script_path = work_dir / info.script
-            if not script_path.exists():
-                print(f"[{info.name}] Script not found: {script_path}")
-                info.status = "error"
-                return
             cmd = [str(self.node_path), str(script_path)]
         elif info.module:
             # Python module mode: python -m module_name
@@ -428,27 +686,60 @@ class ProcessManager:
             # Python script mode (default)
             if not info.script:
                 print(f"[{info.name}] No script or module specified")
-                info.status = "error"
-                return
+                return None
             venv_python = self.get_venv_python(info)
             script_path = work_dir / info.script
-            if not script_path.exists():
-                print(f"[{info.name}] Script not found: {script_path}")
-                info.status = "error"
-                return
             cmd = [str(venv_python), "-u", str(script_path)]
 
         # Add optional arguments
         if info.args:
             cmd.extend([str(arg) for arg in info.args])
 
-        # Build environment variables
-        env = os.environ.copy()
+        # Pre-split "KEY=VALUE" overrides; None means inherit our environment
+        env_overrides = None
         if info.environment:
+            env_overrides = {}
             for env_var in info.environment:
                 if '=' in env_var:
                     key, value = env_var.split('=', 1)
-                    env[key] = value
+                    env_overrides[key] = value
+
+        return (work_dir, script_path, cmd, env_overrides)
+
+    def start_process(self, info: ProcessInfo):
+        if info.is_broken:
+            print(f"[{info.name}] Marked as broken, not starting")
+            return
+
+        if not info.enabled:
+            print(f"[{info.name}] Disabled, not starting")
+            return
+
+        plan = info._launch_plan
+        if plan is None:
+            plan = self._build_launch_plan(info)
+            if plan is None:
+                info.status = "error"
+                return
+            info._launch_plan = plan
+        work_dir, script_path, cmd, env_overrides = plan
+
+        # The existence check stays per-start: it is one stat and gives a
+        # clear error when a script vanishes between restarts
+        if script_path is not None and not script_path.exists():
+            print(f"[{info.name}] Script not found: {script_path}")
+            info.status = "error"
+            return
+
+        log_file = info._log_path
+
+        # Merge pre-parsed overrides over our environment; without any,
+        # env=None lets the child inherit directly with no dict copy
+        if env_overrides:
+            env = os.environ.copy()
+            env.update(env_overrides)
+        else:
+            env = None
 
         try:
             # Creation flags for Windows to ensure process group for termination
@@ -456,19 +747,26 @@ class ProcessManager:
             if IS_WINDOWS:
                 creationflags = subprocess.CREATE_NEW_PROCESS_GROUP
             
-            with open(log_file, "a") as log:
+            # Raw append fd instead of a buffered Python file object: Popen
+            # only needs the fd, and O_CLOEXEC keeps it out of other children
+            log_flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0)
+            log_fd = os.open(log_file, log_flags, 0o644)
+            try:
                 info.process = subprocess.Popen(
                     cmd,
                     cwd=work_dir,
-                    stdout=log,
+                    stdout=log_fd,
                     stderr=subprocess.STDOUT,
                     env=env,
                     start_new_session=not IS_WINDOWS,
                     creationflags=creationflags
                 )
+            finally:
+                os.close(log_fd)
             info.pid = info.process.pid
             info.status = "running"
             info.start_time = datetime.now()
+            info._start_monotonic = time.monotonic()
             if info.type == RUNTIME_EXEC:
                 runtime_info = f"exec: {info.script}"
             elif info.type == RUNTIME_NODE:
@@ -483,62 +781,117 @@ class ProcessManager:
             print(f"[{info.name}] Failed to start: {e}")
             info.status = "error"
 
+    def _wait_for_exit(self, info: ProcessInfo, pid: int, timeout: float = 5.0) -> bool:
+        """Wait up to timeout seconds for pid to exit. Returns True if it did.
+
+        When we have the Popen object, wait() blocks on the child directly
+        (pidfd-backed on Linux) and returns the moment it exits. Only for
+        restored processes we did not spawn do we fall back to polling."""
+        if info.process is not None:
+            try:
+                info.process.wait(timeout=timeout)
+                return True
+            except subprocess.TimeoutExpired:
+                return False
+        if info._pidfd is not None:
+            # Restored process with a pidfd: block in the kernel until it
+            # exits (fd becomes readable) instead of polling kill(pid, 0)
+            poller = select.poll()
+            poller.register(info._pidfd, select.POLLIN)
+            return bool(poller.poll(timeout * 1000))
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not self.is_process_alive(pid):
+                return True
+            time.sleep(0.05)
+        return False
+
+    def _terminate(self, info: ProcessInfo, pid_to_stop: int):
+        """Terminate pid_to_stop: SIGTERM (process group when we spawned
+        it), wait up to 5 s, then SIGKILL if it is still alive.
+
+        Shared by the stop, async-stop and async-restart paths."""
+        have_popen = info.process is not None
+        if IS_WINDOWS:
+            # On Windows, use taskkill to kill the process tree
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid_to_stop)],
+                           capture_output=True,
+                           creationflags=subprocess.CREATE_NO_WINDOW)
+            return
+        if have_popen:
+            # We started this process with start_new_session=True, so it is
+            # its own group leader: pgid == pid, no getpgid syscall needed
+            os.killpg(pid_to_stop, signal.SIGTERM)
+        else:
+            # Restored process - use direct kill (process group may not be accessible)
+            os.kill(pid_to_stop, signal.SIGTERM)
+        if not self._wait_for_exit(info, pid_to_stop):
+            # Force kill if still alive
+            try:
+                if have_popen:
+                    os.killpg(pid_to_stop, signal.SIGKILL)
+                else:
+                    os.kill(pid_to_stop, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
     def stop_process(self, info: ProcessInfo):
         pid_to_stop = info.process.pid if info.process else info.pid
 
-        if pid_to_stop and self.is_process_alive(pid_to_stop):
+        if pid_to_stop and self._liveness(info):
             info.status = "stopping"  # Show stopping status while waiting
             try:
-                if IS_WINDOWS:
-                    # On Windows, we use taskkill to kill the process tree
-                    subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid_to_stop)], 
-                                 capture_output=True, 
-                                 creationflags=subprocess.CREATE_NO_WINDOW)
-                else:
-                    os.killpg(os.getpgid(pid_to_stop), signal.SIGTERM)
-                    # Wait for process to terminate
-                    for _ in range(50):  # 5 seconds max
-                        if not self.is_process_alive(pid_to_stop):
-                            break
-                        time.sleep(0.1)
-                    else:
-                        # Force kill if still alive
-                        try:
-                            os.killpg(os.getpgid(pid_to_stop), signal.SIGKILL)
-                        except ProcessLookupError:
-                            pass
+                self._terminate(info, pid_to_stop)
             except Exception as e:
                 print(f"[{info.name}] Error stopping process: {e}")
 
         info.process = None
+        self._close_pidfd(info)
         info.pid = None
         info.status = "stopped"
         self.save_pids()  # Update PID file after stopping
 
+    def _on_sigchld(self, signum, frame):
+        """SIGCHLD handler - wake the monitor so a dead child is handled
+        immediately instead of up to one tick later.
+
+        Reaping is deliberately left to Popen.poll() in the monitor; calling
+        waitpid(-1) here would steal exit statuses from subprocess."""
+        self._child_exited.set()
+
     def monitor_processes(self):
         while self.running:
+            to_start = []  # (info, delay) launches performed after the lock is released
             with self.lock:
-                for info in self.processes.values():
+                # One locked pass per tick: rotation checks for every
+                # process (even disabled/broken ones that may still be
+                # alive), then liveness/restart logic for the rest. CPU
+                # sampling runs after the lock is released, and only while
+                # someone has polled status recently - the next sample after
+                # a pause averages over the idle window, and clients reseed
+                # from /api/cpu-history on sequence gaps.
+                sample_cpu = (time.monotonic() - self._last_status_request) <= 10
+                self._log_size_cache = self._scan_log_sizes()
+                infos = list(self.processes.values())
+                for info in infos:
+                    self.rotate_log_if_needed(info)
+
                     if not info.enabled or info.is_broken:
                         continue
 
                     # Check if process is running (either via Popen or restored PID)
                     is_running = False
                     if info.process is not None:
-                        # We have a Popen object, use poll()
-                        retcode = info.process.poll()
-                        is_running = (retcode is None)
-                        # Double-check with is_process_alive() if poll() says running
-                        # This catches cases where process was killed externally
-                        if is_running and info.pid is not None:
-                            is_running = self.is_process_alive(info.pid)
+                        # We have a Popen object - poll() is authoritative,
+                        # it reaps and reports external kills too
+                        is_running = (info.process.poll() is None)
                     elif info.pid is not None:
-                        # Restored process, check by PID
-                        is_running = self.is_process_alive(info.pid)
+                        # Restored process, check via pidfd (or PID fallback)
+                        is_running = self._restored_alive(info)
 
                     if not is_running and (info.process is not None or info.pid is not None):
                         # Skip if a user-initiated action (stop/restart) is in progress
-                        if info._user_action_in_progress:
+                        if info._user_action.is_set():
                             continue
 
                         # Process died
@@ -547,7 +900,9 @@ class ProcessManager:
                         info.consecutive_failures += 1
                         info.total_restarts += 1
                         info.last_restart = datetime.now()
+                        info._last_restart_iso = info.last_restart.isoformat()
                         info.process = None
+                        self._close_pidfd(info)
                         info.pid = None
 
                         if info.consecutive_failures >= self.max_failures:
@@ -558,77 +913,141 @@ class ProcessManager:
                             continue
 
                         print(f"[{info.name}] Restarting in {self.restart_delay}s (failure {info.consecutive_failures}/{self.max_failures})")
-                        time.sleep(self.restart_delay)
-                        self.start_process(info)
+                        to_start.append((info, self.restart_delay))
                     elif is_running:
-                        # Process is running fine - reset failures only after stable period
-                        if info.start_time and info.consecutive_failures > 0:
-                            uptime_seconds = (datetime.now() - info.start_time).total_seconds()
-                            if uptime_seconds >= self.failure_reset_seconds:
+                        # Process is running fine - reset failures only after
+                        # stable period (monotonic: no wall-clock drift, no
+                        # datetime allocation in the per-second loop)
+                        if info._start_monotonic is not None and info.consecutive_failures > 0:
+                            if time.monotonic() - info._start_monotonic >= self.failure_reset_seconds:
                                 info.consecutive_failures = 0
-                    elif not info._user_action_in_progress:
+                    elif not info._user_action.is_set():
                         # No process running and no user action in progress, need to start
-                        self.start_process(info)
+                        to_start.append((info, 0))
 
-                # Collect CPU usage and check log rotation for all processes
-                for info in self.processes.values():
+
+            # CPU sampling happens after the lock is dropped: the /proc
+            # reads only touch per-process ring buffers, so holding the
+            # lock across them would stall API handlers for no benefit
+            if sample_cpu:
+                for info in infos:
                     self.collect_cpu_usage(info)
-                    self.rotate_log_if_needed(info)
 
-            time.sleep(1)
+            # Launch (re)starts outside the main critical section so the
+            # restart delay and spawn cost never stall API requests
+            for info, delay in to_start:
+                if delay:
+                    time.sleep(delay)
+                with self.lock:
+                    # Re-check: a user action may have claimed this process
+                    # (or it may have been removed/broken) while unlocked
+                    if (self.running and info.enabled and not info.is_broken
+                            and not info._user_action.is_set()
+                            and info.process is None and info.pid is None
+                            and self.processes.get(info.name) is info):
+                        self.start_process(info)
+
+            # Sleep until the next tick, or immediately when a child exits
+            self._child_exited.wait(timeout=1)
+            self._child_exited.clear()
 
     def get_status(self) -> list[dict]:
         status = []
+        now_monotonic = time.monotonic()
+        self._last_status_request = now_monotonic  # Keeps CPU sampling active
+        # Snapshot the process list and size cache under the lock, then do
+        # all the uptime math and string formatting unlocked so a status
+        # poll never stalls the monitor. Individual attribute reads are
+        # atomic; a field changing mid-build only skews one poll's output.
         with self.lock:
-            for info in self.processes.values():
-                pid = info.pid  # Use stored PID (works for both Popen and restored processes)
-                uptime = None
-                if info.start_time and info.status == "running":
-                    uptime = str(datetime.now() - info.start_time).split(".")[0]
-
-                # Get log file size
-                log_file = self.log_dir / f"{self.sanitize_filename(info.name)}.log"
-                log_size = None
+            infos = list(self.processes.values())
+            log_sizes = self._log_size_cache
+        for info in infos:
+            pid = info.pid  # Use stored PID (works for both Popen and restored processes)
+            uptime = None
+            if info._start_monotonic is not None and info.status == "running":
+                uptime = str(timedelta(seconds=int(now_monotonic - info._start_monotonic)))
+
+            # Get log file size (from the per-tick scandir cache); the
+            # display string is re-derived only when the size changed
+            log_size = log_sizes.get(info._log_path.name)
+            if info._log_size_display is not None and info._log_size_display[0] == log_size:
+                log_size_display = info._log_size_display[1]
+            else:
                 log_size_display = None
-                if log_file.exists():
-                    log_size = log_file.stat().st_size
+                if log_size is not None:
                     if log_size < 1024:
                         log_size_display = f"{log_size} B"
                     elif log_size < 1024 * 1024:
                         log_size_display = f"{log_size / 1024:.1f} KB"
                     else:
                         log_size_display = f"{log_size / (1024 * 1024):.1f} MB"
-
-                # Get CPU data
-                cpu_history = list(info.cpu_history)
-                cpu_current = cpu_history[-1] if cpu_history else 0.0
-
-                status.append({
+                info._log_size_display = (log_size, log_size_display)
+
+            # Config-only fields go into a per-process template dict built
+            # once (invalidated on edit/reload), so each poll only fills in
+            # the runtime fields
+            static = info._static_status
+            if static is None:
+                static = info._static_status = {
                     "name": info.name,
                     "script": info.script,
                     "module": info.module,
                     "type": info.type,
-                    "enabled": info.enabled,
                     "uploaded": info.uploaded,
                     "comment": info.comment,
                     "venv": info.venv,
                     "cwd": info.cwd,
                     "args": info.args,
                     "environment": info.environment,
-                    "status": info.status,
-                    "pid": pid,
-                    "uptime": uptime,
-                    "consecutive_failures": info.consecutive_failures,
-                    "total_restarts": info.total_restarts,
-                    "is_broken": info.is_broken,
-                    "last_restart": info.last_restart.isoformat() if info.last_restart else None,
-                    "log_size": log_size,
-                    "log_size_display": log_size_display,
-                    "cpu_current": round(cpu_current, 1),
-                    "cpu_history": [round(x, 1) for x in cpu_history]
-                })
+                }
+            entry = dict(static)
+            entry.update({
+                "enabled": info.enabled,
+                "status": info.status,
+                "pid": pid,
+                "uptime": uptime,
+                "consecutive_failures": info.consecutive_failures,
+                "total_restarts": info.total_restarts,
+                "is_broken": info.is_broken,
+                "last_restart": info._last_restart_iso,
+                "log_size": log_size,
+                "log_size_display": log_size_display,
+                "cpu_current": info.cpu_current,
+                "cpu_seq": info.cpu_seq
+            })
+            status.append(entry)
         return status
 
+    def get_status_json(self) -> tuple[bytes, str]:
+        """Return the status list serialized to JSON bytes plus an ETag.
+
+        The serialized response is cached for one second so that any
+        number of polling clients cost at most one get_status() call
+        per second. Thread-safe: worst case two threads regenerate
+        concurrently and one result wins.
+        """
+        now = time.monotonic()
+        ts, body, etag = self._status_cache
+        if now - ts < 1.0:
+            return body, etag
+        body = _json_dumps(self.get_status())
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        self._status_cache = (now, body, etag)
+        return body, etag
+
+    def get_cpu_history(self, name: str) -> dict:
+        """Full CPU sample history for one process.
+
+        Status responses carry only the newest sample plus a sequence
+        number; the UI calls this once per row (and after missed ticks)
+        to seed its client-side rolling buffer."""
+        with self.lock:
+            if name not in self.processes:
+                return {"error": f"Unknown process: {name}"}
+            info = self.processes[name]
+            return {"seq": info.cpu_seq, "history": info.cpu_samples()}
+
     def restart_program(self, name: str) -> bool:
         with self.lock:
             if name in self.processes:
@@ -638,7 +1057,7 @@ class ProcessManager:
                 info.status = "restarting"
                 info.enabled = True  # Re-enable if it was stopped
                 info.is_broken = False # Clear broken status
-                info._user_action_in_progress = True  # Prevent monitor interference
+                info._user_action.set()  # Prevent monitor interference
                 # Run actual restart in background thread
                 threading.Thread(
                     target=self._restart_process_async,
@@ -651,39 +1070,16 @@ class ProcessManager:
     def _restart_process_async(self, info: ProcessInfo):
         """Restart process in background thread."""
         pid_to_stop = info.process.pid if info.process else info.pid
-        have_popen = info.process is not None
 
-        if pid_to_stop and self.is_process_alive(pid_to_stop):
+        if pid_to_stop and self._liveness(info):
             try:
-                if IS_WINDOWS:
-                    subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid_to_stop)],
-                                 capture_output=True,
-                                 creationflags=subprocess.CREATE_NO_WINDOW)
-                elif have_popen:
-                    # We started this process, can use process group
-                    os.killpg(os.getpgid(pid_to_stop), signal.SIGTERM)
-                else:
-                    # Restored process - use direct kill
-                    os.kill(pid_to_stop, signal.SIGTERM)
-
-                for _ in range(50):  # 5 seconds max
-                    if not self.is_process_alive(pid_to_stop):
-                        break
-                    time.sleep(0.1)
-                else:
-                    # Force kill if still alive
-                    try:
-                        if have_popen:
-                            os.killpg(os.getpgid(pid_to_stop), signal.SIGKILL)
-                        else:
-                            os.kill(pid_to_stop, signal.SIGKILL)
-                    except ProcessLookupError:
-                        pass
+                self._terminate(info, pid_to_stop)
             except Exception as e:
                 print(f"[{info.name}] Error in restart: {e}")
 
         with self.lock:
             info.process = None
+            self._close_pidfd(info)
             info.pid = None
             info.is_broken = False
             info.consecutive_failures = 0
@@ -692,7 +1088,7 @@ class ProcessManager:
 
         with self.lock:
             self.start_process(info)
-            info._user_action_in_progress = False  # Clear flag to allow monitor to resume
+            info._user_action.clear()  # Clear flag to allow monitor to resume
 
     def stop_program(self, name: str) -> bool:
         with self.lock:
@@ -702,7 +1098,7 @@ class ProcessManager:
                     return True  # Already stopping
                 info.enabled = False
                 info.status = "stopping"
-                info._user_action_in_progress = True  # Prevent monitor interference
+                info._user_action.set()  # Prevent monitor interference
                 # Run actual stop in background thread
                 threading.Thread(
                     target=self._stop_process_async,
@@ -715,43 +1111,19 @@ class ProcessManager:
     def _stop_process_async(self, info: ProcessInfo):
         """Stop process in background thread."""
         pid_to_stop = info.process.pid if info.process else info.pid
-        have_popen = info.process is not None
 
-        if pid_to_stop and self.is_process_alive(pid_to_stop):
+        if pid_to_stop and self._liveness(info):
             try:
-                if IS_WINDOWS:
-                    subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid_to_stop)],
-                                 capture_output=True,
-                                 creationflags=subprocess.CREATE_NO_WINDOW)
-                elif have_popen:
-                    # We started this process, can use process group
-                    os.killpg(os.getpgid(pid_to_stop), signal.SIGTERM)
-                else:
-                    # Restored process - use direct kill (process group may not be accessible)
-                    os.kill(pid_to_stop, signal.SIGTERM)
-
-                # Wait for process to terminate
-                for _ in range(50):  # 5 seconds max
-                    if not self.is_process_alive(pid_to_stop):
-                        break
-                    time.sleep(0.1)
-                else:
-                    # Force kill if still alive
-                    try:
-                        if have_popen:
-                            os.killpg(os.getpgid(pid_to_stop), signal.SIGKILL)
-                        else:
-                            os.kill(pid_to_stop, signal.SIGKILL)
-                    except ProcessLookupError:
-                        pass
+                self._terminate(info, pid_to_stop)
             except Exception as e:
                 print(f"[{info.name}] Error in stop: {e}")
 
         with self.lock:
             info.process = None
+            self._close_pidfd(info)
             info.pid = None
             info.status = "stopped"
-            info._user_action_in_progress = False  # Clear flag to allow monitor to resume
+            info._user_action.clear()  # Clear flag to allow monitor to resume
             self.save_pids()
 
     def start_program(self, name: str) -> bool:
@@ -839,20 +1211,24 @@ class ProcessManager:
 
             # Handle rename
             if new_name and new_name != name:
+                old_log = info._log_path
+                old_log_backup = info._backup_log_path
                 info.name = new_name
                 del self.processes[name]
                 self.processes[new_name] = info
+                self._assign_log_paths(info)
 
-                # Rename log file if exists
-                old_log = self.log_dir / f"{self.sanitize_filename(name)}.log"
-                new_log = self.log_dir / f"{self.sanitize_filename(new_name)}.log"
+                # Rename log file if exists; the line counter is keyed by
+                # path, so drop the stale entry rather than leak it
+                self._log_line_cache.pop(old_log, None)
                 if old_log.exists():
-                    old_log.rename(new_log)
+                    old_log.rename(info._log_path)
                 # Rename backup log too
-                old_log_backup = self.log_dir / f"{self.sanitize_filename(name)}.log.1"
-                new_log_backup = self.log_dir / f"{self.sanitize_filename(new_name)}.log.1"
                 if old_log_backup.exists():
-                    old_log_backup.rename(new_log_backup)
+                    old_log_backup.rename(info._backup_log_path)
+
+            info._static_status = None  # Config fields changed; rebuild status template
+            info._launch_plan = None
 
         # Save to disk
         self.save_programs()
@@ -893,6 +1269,7 @@ class ProcessManager:
                 args=args,
                 environment=environment
             )
+            self._assign_log_paths(self.processes[name])
 
         self.save_programs()
 
@@ -901,31 +1278,99 @@ class ProcessManager:
 
         return {"success": True, "message": f"Program '{name}' added successfully."}
 
+    def _count_log_lines(self, log_file: Path) -> int:
+        """Count lines in a log file, tracked incrementally by size.
+
+        Logs are append-only between rotations, so once a count exists
+        only the bytes added since the last call are scanned. A shrink
+        (rotation/truncate) resets the counter and triggers a full scan."""
+        size = os.stat(log_file).st_size
+        cached = self._log_line_cache.get(log_file)
+        if cached is not None and cached[0] == size:
+            newlines, last_byte = cached[1], cached[2]
+        else:
+            if cached is not None and cached[0] < size:
+                start, newlines, last_byte = cached
+            else:
+                start, newlines, last_byte = 0, 0, b"\n"
+            # Unbuffered: we already read in 1MB chunks, so the extra copy
+            # through a BufferedReader would be pure overhead. Reads are
+            # clamped to the stat'd size so bytes appended mid-scan are
+            # not counted now and again on the next call.
+            remaining = size - start
+            with open(log_file, "rb", buffering=0) as f:
+                if start:
+                    f.seek(start)
+                while remaining > 0:
+                    chunk = f.read(min(1024 * 1024, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    newlines += chunk.count(b"\n")
+                    last_byte = chunk[-1:]
+            self._log_line_cache[log_file] = (size, newlines, last_byte)
+
+        count = newlines
+        if last_byte != b"\n":
+            count += 1  # Unterminated final line still counts
+        return count
+
+    @staticmethod
+    def _read_tail_window(log_file: Path, lines: int, offset: int) -> str:
+        """Return `lines` lines ending `offset` lines before EOF.
+
+        Reads the file backwards in 64KB chunks, so the cost is bounded
+        by the requested window rather than the file size."""
+        needed = lines + offset
+        # Unbuffered: the read pattern is backward seeks of 64KB blocks,
+        # which defeats BufferedReader's read-ahead and doubles the copies
+        with open(log_file, "rb", buffering=0) as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            buf = b""
+            while pos > 0 and buf.count(b"\n") <= needed:
+                read_size = min(64 * 1024, pos)
+                pos -= read_size
+                f.seek(pos)
+                buf = f.read(read_size) + buf
+
+        # Split on \n only (splitlines also breaks on bare \r, which
+        # would disagree with the \n-based counts used for pagination)
+        tail_lines = [line + b"\n" for line in buf.split(b"\n")]
+        tail_lines[-1] = tail_lines[-1][:-1]  # No \n after the final split piece
+        if not tail_lines[-1]:
+            tail_lines.pop()  # Buffer ended with \n - no unterminated line
+        if pos > 0 and tail_lines:
+            tail_lines = tail_lines[1:]  # First element starts mid-line
+
+        end = len(tail_lines) - offset
+        selected = tail_lines[max(0, end - lines):max(0, end)]
+        return b"".join(selected).decode("utf-8", errors="replace")
+
     def get_log_content(self, name: str, lines: int = 100, offset: int = 0) -> dict:
         """Get log content for a process using tail-like behavior."""
         if name not in self.processes:
             return {"error": "Process not found", "content": None}
 
-        log_file = self.log_dir / f"{self.sanitize_filename(name)}.log"
+        log_file = self.processes[name]._log_path
         if not log_file.exists():
             return {"error": "Log file not found", "content": None, "total_lines": 0}
 
         try:
-            with open(log_file, "r", encoding="utf-8", errors="replace") as f:
-                all_lines = f.readlines()
-
-            total_lines = len(all_lines)
+            total_lines = self._count_log_lines(log_file)
 
             # Calculate start position for tail with offset
             # offset=0 means last 'lines' lines, offset=100 means 100 lines before that, etc.
-            end_pos = total_lines - offset
+            end_pos = max(0, total_lines - offset)
             start_pos = max(0, end_pos - lines)
-            end_pos = max(0, end_pos)
 
-            selected_lines = all_lines[start_pos:end_pos]
+            if end_pos > start_pos:
+                content = self._read_tail_window(log_file, end_pos - start_pos, total_lines - end_pos)
+            else:
+                content = ""
 
             return {
-                "content": "".join(selected_lines),
+                "content": content,
                 "total_lines": total_lines,
                 "start_line": start_pos + 1,
                 "end_line": end_pos,
@@ -934,6 +1379,37 @@ class ProcessManager:
         except Exception as e:
             return {"error": str(e), "content": None}
 
+    def get_log_range(self, name: str, end: int = None, size: int = 65536) -> dict:
+        """Read a bounded byte range from the tail of a process log.
+
+        Unlike get_log_content this never touches line counts - one seek
+        and one read of at most `size` bytes - and returns raw bytes for
+        the plain-text endpoint. The partial first line after seeking is
+        dropped so the window always starts on a line boundary."""
+        if name not in self.processes:
+            return {"error": "Process not found"}
+
+        log_file = self.processes[name]._log_path
+        if not log_file.exists():
+            return {"data": b"", "total_size": 0, "start": 0}
+
+        try:
+            with open(log_file, "rb", buffering=0) as f:
+                total = f.seek(0, os.SEEK_END)
+                if end is None or end > total:
+                    end = total
+                start = max(0, end - size)
+                f.seek(start)
+                data = f.read(end - start)
+            if start > 0:
+                newline = data.find(b"\n")
+                if newline >= 0:
+                    data = data[newline + 1:]
+                    start += newline + 1
+            return {"data": data, "total_size": total, "start": start}
+        except Exception as e:
+            return {"error": str(e)}
+
     def upload_program(self, name: str, zip_data: bytes, script: str, prog_type: str = RUNTIME_PYTHON,
                        enabled: bool = True, args: list = None, environment: list = None, comment: str = None) -> dict:
         """Upload a new program from ZIP file.
@@ -982,6 +1458,7 @@ class ProcessManager:
                     environment=environment,
                     status="installing" if prog_type != RUNTIME_EXEC else "stopped"
                 )
+                self._assign_log_paths(self.processes[name])
             # Save config outside lock to avoid deadlock
             self.save_programs()
 
@@ -1005,65 +1482,75 @@ class ProcessManager:
             return {"success": False, "message": f"Upload failed: {str(e)}"}
 
     def _install_program_async(self, name: str, program_dir: Path, prog_type: str, should_start: bool):
-        """Install program (venv/npm + dependencies) in background thread."""
+        """Install program (venv/npm + dependencies) in background thread.
+
+        The install log is opened once and shared with the helpers and
+        their subprocesses instead of re-opening per section."""
         log_file = self.log_dir / f"{self.sanitize_filename(name)}.log"
+        log = open(log_file, "a", buffering=1 << 16)
 
         try:
             # Write initial log message
-            with open(log_file, "a") as log:
-                log.write(f"\n{'='*70}\n")
-                log.write(f"Program Upload: {name}\n")
-                log.write(f"Type: {prog_type}\n")
-                log.write(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                log.write(f"Directory: {program_dir}\n")
-                log.write(f"{'='*70}\n\n")
+            log.write(f"\n{'='*70}\n")
+            log.write(f"Program Upload: {name}\n")
+            log.write(f"Type: {prog_type}\n")
+            log.write(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            log.write(f"Directory: {program_dir}\n")
+            log.write(f"{'='*70}\n\n")
 
             if prog_type == RUNTIME_NODE:
                 # Node.js: run npm install if package.json exists
                 package_json = program_dir / "package.json"
                 if package_json.exists():
-                    result = self._install_npm_dependencies(program_dir, log_file)
+                    result = self._install_npm_dependencies(program_dir, log)
                     if not result["success"]:
                         with self.lock:
                             if name in self.processes:
                                 self.processes[name].status = "error"
-                        with open(log_file, "a") as log:
-                            log.write(f"\n[FAILED] Installation failed: {result['message']}\n")
+                        log.write(f"\n[FAILED] Installation failed: {result['message']}\n")
                         return
                 else:
-                    with open(log_file, "a") as log:
-                        log.write(f"No package.json found, skipping npm install.\n\n")
+                    log.write(f"No package.json found, skipping npm install.\n\n")
             else:
-                # Python: create venv and install requirements
-                result = self._create_venv(program_dir, log_file)
-                if not result["success"]:
-                    with self.lock:
-                        if name in self.processes:
-                            self.processes[name].status = "error"
-                    with open(log_file, "a") as log:
-                        log.write(f"\n[FAILED] Installation failed: {result['message']}\n")
-                    return
-
-                # Install dependencies if requirements.txt exists
+                # Python: reuse a cached venv for identical requirements,
+                # otherwise create one and install dependencies
                 requirements_file = program_dir / "requirements.txt"
+                template = None
                 if requirements_file.exists():
-                    result = self._install_requirements(program_dir, log_file)
+                    key = hashlib.sha256(requirements_file.read_bytes()).hexdigest()
+                    template = self.venv_template_dir / key
+
+                if template is not None and self._copy_venv_template(template, program_dir, log):
+                    pass  # Environment materialized from the template
+                else:
+                    result = self._create_venv(program_dir, log)
                     if not result["success"]:
                         with self.lock:
                             if name in self.processes:
                                 self.processes[name].status = "error"
-                        with open(log_file, "a") as log:
-                            log.write(f"\n[FAILED] Installation failed: {result['message']}\n")
+                        log.write(f"\n[FAILED] Installation failed: {result['message']}\n")
                         return
-                else:
-                    with open(log_file, "a") as log:
+
+                    # Install dependencies if requirements.txt exists
+                    if requirements_file.exists():
+                        result = self._install_requirements(program_dir, log)
+                        if not result["success"]:
+                            with self.lock:
+                                if name in self.processes:
+                                    self.processes[name].status = "error"
+                            log.write(f"\n[FAILED] Installation failed: {result['message']}\n")
+                            return
+                        self._store_venv_template(template, program_dir)
+                    else:
                         log.write(f"No requirements.txt found, skipping pip install.\n\n")
 
             # Installation successful
-            with open(log_file, "a") as log:
-                log.write(f"\n{'='*70}\n")
-                log.write(f"[SUCCESS] Installation completed successfully!\n")
-                log.write(f"{'='*70}\n\n")
+            log.write(f"\n{'='*70}\n")
+            log.write(f"[SUCCESS] Installation completed successfully!\n")
+            log.write(f"{'='*70}\n\n")
+            # Drain the buffer before the child starts appending to the
+            # same file, so its output can't land ahead of the banner
+            log.flush()
 
             # Start the program if enabled
             with self.lock:
@@ -1078,8 +1565,9 @@ class ProcessManager:
             with self.lock:
                 if name in self.processes:
                     self.processes[name].status = "error"
-            with open(log_file, "a") as log:
-                log.write(f"\n[ERROR] Installation exception: {str(e)}\n")
+            log.write(f"\n[ERROR] Installation exception: {str(e)}\n")
+        finally:
+            log.close()
 
     def update_program(self, name: str, zip_data: bytes) -> dict:
         """Update an existing program's code.
@@ -1178,26 +1666,25 @@ class ProcessManager:
     def _update_program_async(self, name: str, program_dir: Path, backup_dir: Path, prog_type: str):
         """Update program dependencies in background thread."""
         log_file = self.log_dir / f"{self.sanitize_filename(name)}.log"
+        log = open(log_file, "a", buffering=1 << 16)
 
         try:
             # Write initial log message
-            with open(log_file, "a") as log:
-                log.write(f"\n{'='*70}\n")
-                log.write(f"Program Update: {name}\n")
-                log.write(f"Type: {prog_type}\n")
-                log.write(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                log.write(f"{'='*70}\n\n")
+            log.write(f"\n{'='*70}\n")
+            log.write(f"Program Update: {name}\n")
+            log.write(f"Type: {prog_type}\n")
+            log.write(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            log.write(f"{'='*70}\n\n")
 
             # Install dependencies based on type
             if prog_type == RUNTIME_NODE:
-                result = self._install_npm_dependencies(program_dir, log_file)
+                result = self._install_npm_dependencies(program_dir, log)
             else:
-                result = self._install_requirements(program_dir, log_file)
+                result = self._install_requirements(program_dir, log)
 
             if not result["success"]:
                 # Restore backup
-                with open(log_file, "a") as log:
-                    log.write(f"\n[FAILED] Update failed, restoring backup...\n")
+                log.write(f"\n[FAILED] Update failed, restoring backup...\n")
                 shutil.rmtree(program_dir, ignore_errors=True)
                 shutil.move(str(backup_dir), str(program_dir))
                 with self.lock:
@@ -1206,10 +1693,9 @@ class ProcessManager:
                 return
 
             # Update successful
-            with open(log_file, "a") as log:
-                log.write(f"\n{'='*70}\n")
-                log.write(f"[SUCCESS] Update completed successfully!\n")
-                log.write(f"{'='*70}\n\n")
+            log.write(f"\n{'='*70}\n")
+            log.write(f"[SUCCESS] Update completed successfully!\n")
+            log.write(f"{'='*70}\n\n")
 
             # Remove backup
             shutil.rmtree(backup_dir, ignore_errors=True)
@@ -1222,13 +1708,14 @@ class ProcessManager:
         except Exception as e:
             # Restore backup if it exists
             if backup_dir.exists():
-                with open(log_file, "a") as log:
-                    log.write(f"\n[ERROR] Update exception, restoring backup: {str(e)}\n")
+                log.write(f"\n[ERROR] Update exception, restoring backup: {str(e)}\n")
                 shutil.rmtree(program_dir, ignore_errors=True)
                 shutil.move(str(backup_dir), str(program_dir))
             with self.lock:
                 if name in self.processes:
                     self.processes[name].status = "error"
+        finally:
+            log.close()
 
     def remove_program(self, name: str) -> dict:
         """Remove a program.
@@ -1246,8 +1733,12 @@ class ProcessManager:
             if info.status != "stopped":
                 return {"success": False, "message": f"Program '{name}' must be stopped before removal."}
 
+            log_file = info._log_path
+            log_backup = info._backup_log_path
+
             # Remove from processes
             del self.processes[name]
+            self._log_line_cache.pop(log_file, None)
 
         # Save config outside lock to avoid deadlock
         self.save_programs()
@@ -1258,10 +1749,8 @@ class ProcessManager:
             if program_dir.exists():
                 shutil.rmtree(program_dir)
             # Remove log file
-            log_file = self.log_dir / f"{self.sanitize_filename(name)}.log"
             if log_file.exists():
                 log_file.unlink()
-            log_backup = self.log_dir / f"{self.sanitize_filename(name)}.log.1"
             if log_backup.exists():
                 log_backup.unlink()
             return {"success": True, "message": f"Program '{name}' removed successfully."}
@@ -1275,6 +1764,11 @@ class ProcessManager:
         - Files directly in ZIP root
         - Single top-level directory containing all files (flattens automatically)
         """
+        # Imported on first upload rather than at module load - ZIP
+        # handling is never needed on the monitor or status paths
+        import tempfile
+        import zipfile
+
         try:
             with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp_file:
                 tmp_file.write(zip_data)
@@ -1309,25 +1803,93 @@ class ProcessManager:
         except Exception as e:
             return {"success": False, "message": f"Extraction failed: {str(e)}"}
 
-    def _create_venv(self, program_dir: Path, log_file: Path = None) -> dict:
-        """Create a virtual environment for the program."""
+    def _copy_venv_template(self, template: Path, program_dir: Path, log=None) -> bool:
+        """Materialize program_dir/.venv from a cached template, if one exists.
+
+        The interpreter inside a venv is a symlink and site-packages are
+        plain files, so a symlink-preserving copy yields a working
+        environment without re-running venv + pip. Returns False (and
+        lets the caller do a fresh install) when there is no template or
+        the copy fails."""
+        if not template.exists():
+            return False
+        venv_dir = program_dir / ".venv"
+        try:
+            shutil.copytree(template, venv_dir, symlinks=True)
+            self._rewrite_venv_shebangs(venv_dir)
+        except Exception as e:
+            shutil.rmtree(venv_dir, ignore_errors=True)
+            print(f"Failed to copy venv template {template.name}: {e}")
+            return False
+        if log:
+            log.write(f"Requirements unchanged from a previous install - "
+                      f"reusing cached environment ({template.name[:12]}...)\n\n")
+        return True
+
+    @staticmethod
+    def _rewrite_venv_shebangs(venv_dir: Path):
+        """Point console-script shebangs at venv_dir's own interpreter.
+
+        pip bakes the absolute interpreter path into every entry-point
+        script, so scripts copied from a template still name the venv of
+        whichever program was installed first (and break outright once
+        that program is removed)."""
+        bin_dir = venv_dir / ("Scripts" if IS_WINDOWS else "bin")
+        python_name = "python.exe" if IS_WINDOWS else "python"
+        shebang = f"#!{bin_dir / python_name}\n".encode()
+        try:
+            entries = list(bin_dir.iterdir())
+        except OSError:
+            return
+        for path in entries:
+            if path.is_symlink() or not path.is_file():
+                continue
+            try:
+                data = path.read_bytes()
+                if not data.startswith(b"#!"):
+                    continue
+                end = data.index(b"\n")
+                first_line = data[:end]
+                if b".venv" not in first_line or first_line == shebang[:-1]:
+                    continue
+                path.write_bytes(shebang + data[end + 1:])
+            except (OSError, ValueError):
+                continue
+
+    def _store_venv_template(self, template: Path, program_dir: Path):
+        """Cache a freshly installed venv under its requirements hash."""
+        if template is None or template.exists():
+            return
+        tmp = template.with_name(template.name + ".tmp")
+        try:
+            shutil.rmtree(tmp, ignore_errors=True)
+            shutil.copytree(program_dir / ".venv", tmp, symlinks=True)
+            os.replace(tmp, template)  # Atomic: concurrent installs can't see a half-copied template
+        except Exception as e:
+            shutil.rmtree(tmp, ignore_errors=True)
+            print(f"Failed to cache venv template: {e}")
+
+    def _create_venv(self, program_dir: Path, log=None) -> dict:
+        """Create a virtual environment for the program.
+
+        log is an open append-mode handle shared across the whole
+        install (see _install_program_async), or None to capture output."""
         venv_dir = program_dir / ".venv"
         try:
-            if log_file:
-                with open(log_file, "a") as log:
-                    log.write(f"\n{'='*60}\n")
-                    log.write(f"Creating virtual environment...\n")
-                    log.write(f"Command: {sys.executable} -m venv {venv_dir}\n")
-                    log.write(f"{'='*60}\n")
-                    log.flush()
-
-                    result = subprocess.run(
-                        [sys.executable, "-m", "venv", str(venv_dir)],
-                        stdout=log,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        timeout=60
-                    )
+            if log:
+                log.write(f"\n{'='*60}\n")
+                log.write(f"Creating virtual environment...\n")
+                log.write(f"Command: {sys.executable} -m venv {venv_dir}\n")
+                log.write(f"{'='*60}\n")
+                log.flush()  # Keep ordering: our header before the child's output
+
+                result = subprocess.run(
+                    [sys.executable, "-m", "venv", str(venv_dir)],
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    timeout=60
+                )
             else:
                 result = subprocess.run(
                     [sys.executable, "-m", "venv", str(venv_dir)],
@@ -1337,29 +1899,25 @@ class ProcessManager:
                 )
 
             if result.returncode != 0:
-                msg = "venv creation failed (see logs for details)" if log_file else f"venv creation failed: {result.stderr}"
-                if log_file:
-                    with open(log_file, "a") as log:
-                        log.write(f"\n[ERROR] venv creation failed with code {result.returncode}\n")
+                msg = "venv creation failed (see logs for details)" if log else f"venv creation failed: {result.stderr}"
+                if log:
+                    log.write(f"\n[ERROR] venv creation failed with code {result.returncode}\n")
                 return {"success": False, "message": msg}
 
-            if log_file:
-                with open(log_file, "a") as log:
-                    log.write(f"\n[SUCCESS] Virtual environment created successfully\n\n")
+            if log:
+                log.write(f"\n[SUCCESS] Virtual environment created successfully\n\n")
 
             return {"success": True, "message": "Virtual environment created."}
         except subprocess.TimeoutExpired:
-            if log_file:
-                with open(log_file, "a") as log:
-                    log.write(f"\n[ERROR] venv creation timed out after 60 seconds\n")
+            if log:
+                log.write(f"\n[ERROR] venv creation timed out after 60 seconds\n")
             return {"success": False, "message": "venv creation timed out."}
         except Exception as e:
-            if log_file:
-                with open(log_file, "a") as log:
-                    log.write(f"\n[ERROR] venv creation failed: {str(e)}\n")
+            if log:
+                log.write(f"\n[ERROR] venv creation failed: {str(e)}\n")
             return {"success": False, "message": f"venv creation failed: {str(e)}"}
 
-    def _install_requirements(self, program_dir: Path, log_file: Path = None) -> dict:
+    def _install_requirements(self, program_dir: Path, log=None) -> dict:
         """Install requirements.txt in the program's virtual environment."""
         if IS_WINDOWS:
             venv_python = program_dir / ".venv" / "Scripts" / "python.exe"
@@ -1371,79 +1929,83 @@ class ProcessManager:
         if not venv_python.exists():
             return {"success": False, "message": "Virtual environment not found."}
 
+        # All programs share one wheel cache: repeat installs of common
+        # packages become local copies instead of PyPI downloads
+        pip_cmd = [str(venv_python), "-m", "pip", "install",
+                   "--cache-dir", str(self.pip_cache_dir), "-r", str(requirements_file)]
+        pip_env = {**os.environ,
+                   "PIP_CACHE_DIR": str(self.pip_cache_dir),
+                   "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+
         try:
-            if log_file:
-                with open(log_file, "a") as log:
-                    log.write(f"{'='*60}\n")
-                    log.write(f"Installing dependencies from requirements.txt...\n")
-                    log.write(f"Command: {venv_python} -m pip install -r {requirements_file}\n")
-                    log.write(f"{'='*60}\n")
-                    log.flush()
-
-                    result = subprocess.run(
-                        [str(venv_python), "-m", "pip", "install", "-r", str(requirements_file)],
-                        stdout=log,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        timeout=300,  # 5 minutes max
-                        cwd=program_dir
-                    )
+            if log:
+                log.write(f"{'='*60}\n")
+                log.write(f"Installing dependencies from requirements.txt...\n")
+                log.write(f"Command: {venv_python} -m pip install -r {requirements_file}\n")
+                log.write(f"{'='*60}\n")
+                log.flush()
+
+                result = subprocess.run(
+                    pip_cmd,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    timeout=300,  # 5 minutes max
+                    cwd=program_dir,
+                    env=pip_env
+                )
             else:
                 result = subprocess.run(
-                    [str(venv_python), "-m", "pip", "install", "-r", str(requirements_file)],
+                    pip_cmd,
                     capture_output=True,
                     text=True,
                     timeout=300,
-                    cwd=program_dir
+                    cwd=program_dir,
+                    env=pip_env
                 )
 
             if result.returncode != 0:
-                msg = "pip install failed (see logs for details)" if log_file else f"pip install failed: {result.stderr}"
-                if log_file:
-                    with open(log_file, "a") as log:
-                        log.write(f"\n[ERROR] pip install failed with code {result.returncode}\n")
+                msg = "pip install failed (see logs for details)" if log else f"pip install failed: {result.stderr}"
+                if log:
+                    log.write(f"\n[ERROR] pip install failed with code {result.returncode}\n")
                 return {"success": False, "message": msg}
 
-            if log_file:
-                with open(log_file, "a") as log:
-                    log.write(f"\n[SUCCESS] Dependencies installed successfully\n")
-                    log.write(f"{'='*60}\n\n")
+            if log:
+                log.write(f"\n[SUCCESS] Dependencies installed successfully\n")
+                log.write(f"{'='*60}\n\n")
 
             return {"success": True, "message": "Requirements installed."}
         except subprocess.TimeoutExpired:
-            if log_file:
-                with open(log_file, "a") as log:
-                    log.write(f"\n[ERROR] pip install timed out after 5 minutes\n")
+            if log:
+                log.write(f"\n[ERROR] pip install timed out after 5 minutes\n")
             return {"success": False, "message": "pip install timed out (>5 minutes)."}
         except Exception as e:
-            if log_file:
-                with open(log_file, "a") as log:
-                    log.write(f"\n[ERROR] pip install failed: {str(e)}\n")
+            if log:
+                log.write(f"\n[ERROR] pip install failed: {str(e)}\n")
             return {"success": False, "message": f"pip install failed: {str(e)}"}
 
-    def _install_npm_dependencies(self, program_dir: Path, log_file: Path = None) -> dict:
+    def _install_npm_dependencies(self, program_dir: Path, log=None) -> dict:
         """Install Node.js dependencies using npm install."""
         npm_path = shutil.which("npm")
         if not npm_path:
             return {"success": False, "message": "npm not found. Install Node.js/npm."}
 
         try:
-            if log_file:
-                with open(log_file, "a") as log:
-                    log.write(f"{'='*60}\n")
-                    log.write(f"Installing Node.js dependencies...\n")
-                    log.write(f"Command: npm install\n")
-                    log.write(f"{'='*60}\n")
-                    log.flush()
-
-                    result = subprocess.run(
-                        [npm_path, "install"],
-                        stdout=log,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        timeout=300,  # 5 minutes max
-                        cwd=program_dir
-                    )
+            if log:
+                log.write(f"{'='*60}\n")
+                log.write(f"Installing Node.js dependencies...\n")
+                log.write(f"Command: npm install\n")
+                log.write(f"{'='*60}\n")
+                log.flush()
+
+                result = subprocess.run(
+                    [npm_path, "install"],
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    timeout=300,  # 5 minutes max
+                    cwd=program_dir
+                )
             else:
                 result = subprocess.run(
                     [npm_path, "install"],
@@ -1454,33 +2016,28 @@ class ProcessManager:
                 )
 
             if result.returncode != 0:
-                msg = "npm install failed (see logs for details)" if log_file else f"npm install failed: {result.stderr}"
-                if log_file:
-                    with open(log_file, "a") as log:
-                        log.write(f"\n[ERROR] npm install failed with code {result.returncode}\n")
+                msg = "npm install failed (see logs for details)" if log else f"npm install failed: {result.stderr}"
+                if log:
+                    log.write(f"\n[ERROR] npm install failed with code {result.returncode}\n")
                 return {"success": False, "message": msg}
 
-            if log_file:
-                with open(log_file, "a") as log:
-                    log.write(f"\n[SUCCESS] Node.js dependencies installed successfully\n")
-                    log.write(f"{'='*60}\n\n")
+            if log:
+                log.write(f"\n[SUCCESS] Node.js dependencies installed successfully\n")
+                log.write(f"{'='*60}\n\n")
 
             return {"success": True, "message": "npm packages installed."}
         except subprocess.TimeoutExpired:
-            if log_file:
-                with open(log_file, "a") as log:
-                    log.write(f"\n[ERROR] npm install timed out after 5 minutes\n")
+            if log:
+                log.write(f"\n[ERROR] npm install timed out after 5 minutes\n")
             return {"success": False, "message": "npm install timed out (>5 minutes)."}
         except Exception as e:
-            if log_file:
-                with open(log_file, "a") as log:
-                    log.write(f"\n[ERROR] npm install failed: {str(e)}\n")
+            if log:
+                log.write(f"\n[ERROR] npm install failed: {str(e)}\n")
             return {"success": False, "message": f"npm install failed: {str(e)}"}
 
     def shutdown(self):
         """Shutdown the process manager without stopping managed processes."""
         print("\nShutting down process manager...")
         self.running = False
-        with self.lock:
-            self.save_pids()  # Save current state for next startup
+        self._write_pids_now()  # Final synchronous write for next startup
         print("Process manager stopped. Managed processes continue running.")
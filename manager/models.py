@@ -10,9 +10,11 @@ the Free Software Foundation, either version 3 of the License, or
 """
 
 import subprocess
+import threading
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
-from collections import deque
+from pathlib import Path
 
 # Number of CPU history points to keep (at 1 sample per second = 300 points = 5 minutes of history)
 CPU_HISTORY_SIZE = 300
@@ -45,7 +47,48 @@ class ProcessInfo:
     is_broken: bool = False
     start_time: datetime = None
     last_restart: datetime = None
+    _start_monotonic: float = None  # time.monotonic() at start, for cheap uptime math
+    _last_restart_iso: str = None  # last_restart.isoformat(), precomputed at assignment
     total_restarts: int = 0
-    _user_action_in_progress: bool = False  # Flag to prevent monitor interference during explicit actions
-    cpu_history: deque = field(default_factory=lambda: deque(maxlen=CPU_HISTORY_SIZE))
+    # Set while an explicit stop/restart is running; an Event so workers can
+    # flip it without taking the manager lock
+    _user_action: threading.Event = field(default_factory=threading.Event)
+    _sanitized_name: str = None  # Cached sanitize_filename(name), set by the manager
+    _log_path: Path = None  # Cached log file path (derived from name, constant until rename)
+    _backup_log_path: Path = None  # Cached rotated log path (.log.1)
+    _log_size_display: tuple = None  # (size bytes, human-readable string) memo
+    _static_status: dict = None  # Config-only status fields, rebuilt when the program is edited
+    _launch_plan: tuple = None  # Resolved (work_dir, script_path, cmd, env overrides), invalidated on edit/reload
+    # CPU history as a fixed-size ring buffer: one contiguous block of doubles
+    # instead of a deque of boxed floats (better memory and cache behavior)
+    cpu_history: array = field(default_factory=lambda: array('d', [0.0] * CPU_HISTORY_SIZE))
+    _cpu_head: int = 0  # Next write position in the ring
+    _cpu_len: int = 0  # Number of valid samples (up to CPU_HISTORY_SIZE)
+    cpu_seq: int = 0  # Total samples ever appended; lets clients detect missed ticks
     _psutil_process: object = None  # Cache psutil.Process object
+    _pidfd: int = None  # pidfd for restored processes (Linux 5.3+, immune to PID reuse)
+    _stat_fd: int = None  # Persistent /proc/<pid>/stat fd for CPU sampling (Linux)
+    _stat_fd_pid: int = None  # PID the stat fd was opened for
+    _stat_prev: tuple = None  # (jiffies, monotonic timestamp) of the previous sample
+
+    def append_cpu_sample(self, value: float):
+        """Append a CPU sample, overwriting the oldest once the ring is full."""
+        self.cpu_history[self._cpu_head] = value
+        self._cpu_head = (self._cpu_head + 1) % CPU_HISTORY_SIZE
+        if self._cpu_len < CPU_HISTORY_SIZE:
+            self._cpu_len += 1
+        self.cpu_seq += 1
+
+    @property
+    def cpu_current(self) -> float:
+        """The most recent CPU sample, or 0.0 before any were collected."""
+        if self._cpu_len == 0:
+            return 0.0
+        return self.cpu_history[(self._cpu_head - 1) % CPU_HISTORY_SIZE]
+
+    def cpu_samples(self) -> list:
+        """Return the CPU history oldest-first as a plain list."""
+        if self._cpu_len < CPU_HISTORY_SIZE:
+            return self.cpu_history[:self._cpu_len].tolist()
+        head = self._cpu_head
+        return (self.cpu_history[head:] + self.cpu_history[:head]).tolist()
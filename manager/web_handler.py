@@ -10,12 +10,14 @@ the Free Software Foundation, either version 3 of the License, or
 """
 
 import json
+import time
 from http.server import BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs, unquote
 from email import message_from_bytes
 from email.policy import default
 
-from .web_template import get_html
+from .manager import _json_dumps
+from .web_template import get_html_bytes
 
 
 class WebHandler(BaseHTTPRequestHandler):
@@ -59,15 +61,68 @@ class WebHandler(BaseHTTPRequestHandler):
 
     def do_GET(self):
         if self.path == "/" or self.path == "/index.html":
+            accept_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+            body = get_html_bytes(self.manager.web_title, gzipped=accept_gzip)
             self.send_response(200)
             self.send_header("Content-type", "text/html; charset=utf-8")
+            if accept_gzip:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
             self.end_headers()
-            self.wfile.write(get_html(self.manager.web_title).encode())
+            self.wfile.write(body)
         elif self.path == "/api/status":
+            body, etag = self.manager.get_status_json()
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
             self.send_response(200)
             self.send_header("Content-type", "application/json")
+            self.send_header("ETag", etag)
             self.end_headers()
-            self.wfile.write(json.dumps(self.manager.get_status()).encode())
+            self.wfile.write(body)
+        elif self.path == "/api/status/stream":
+            self._handle_status_stream()
+        elif self.path.startswith("/api/cpu-history/"):
+            parts = self.path.split("/")
+            if len(parts) >= 4:
+                name = unquote(parts[3])
+                result = self.manager.get_cpu_history(name)
+                self.send_response(200 if "error" not in result else 404)
+                self.send_header("Content-type", "application/json")
+                self.end_headers()
+                self.wfile.write(_json_dumps(result))
+            else:
+                self.send_response(400)
+                self.end_headers()
+        elif self.path.startswith("/api/logs_raw/"):
+            # Parse: /api/logs_raw/{name}?end=<bytes>&size=<bytes>
+            parsed = urlparse(self.path)
+            parts = parsed.path.split("/")
+            if len(parts) >= 4:
+                name = unquote(parts[3])
+                params = parse_qs(parsed.query)
+                end = int(params.get("end", [0])[0]) or None
+                size = int(params.get("size", [65536])[0])
+
+                result = self.manager.get_log_range(name, end, size)
+                if "error" in result:
+                    self.send_response(404)
+                    self.send_header("Content-type", "application/json")
+                    self.end_headers()
+                    self.wfile.write(_json_dumps(result))
+                    return
+                self.send_response(200)
+                self.send_header("Content-type", "text/plain; charset=utf-8")
+                self.send_header("Content-Length", str(len(result["data"])))
+                self.send_header("X-Total-Size", str(result["total_size"]))
+                self.send_header("X-Start-Offset", str(result["start"]))
+                self.end_headers()
+                self.wfile.write(result["data"])
+            else:
+                self.send_response(400)
+                self.end_headers()
         elif self.path.startswith("/api/logs/"):
             # Parse: /api/logs/{name}?lines=100&offset=0
             parsed = urlparse(self.path)
@@ -82,7 +137,7 @@ class WebHandler(BaseHTTPRequestHandler):
                 self.send_response(200)
                 self.send_header("Content-type", "application/json; charset=utf-8")
                 self.end_headers()
-                self.wfile.write(json.dumps(result).encode())
+                self.wfile.write(_json_dumps(result))
             else:
                 self.send_response(400)
                 self.end_headers()
@@ -100,13 +155,13 @@ class WebHandler(BaseHTTPRequestHandler):
             self.send_response(200 if result["success"] else 400)
             self.send_header("Content-type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+            self.wfile.write(_json_dumps(result))
         elif self.path == "/api/reset-all-restarts":
             result = self.manager.reset_all_restarts()
             self.send_response(200 if result["success"] else 400)
             self.send_header("Content-type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+            self.wfile.write(_json_dumps(result))
         elif self.path.startswith("/api/reset-restarts/"):
             parts = self.path.split("/")
             if len(parts) >= 4:
@@ -115,7 +170,7 @@ class WebHandler(BaseHTTPRequestHandler):
                 self.send_response(200 if result["success"] else 400)
                 self.send_header("Content-type", "application/json")
                 self.end_headers()
-                self.wfile.write(json.dumps(result).encode())
+                self.wfile.write(_json_dumps(result))
             else:
                 self.send_response(400)
                 self.end_headers()
@@ -143,7 +198,7 @@ class WebHandler(BaseHTTPRequestHandler):
                 self.send_response(200 if result["success"] else 400)
                 self.send_header("Content-type", "application/json; charset=utf-8")
                 self.end_headers()
-                self.wfile.write(json.dumps(result).encode())
+                self.wfile.write(_json_dumps(result))
             else:
                 self.send_response(400)
                 self.end_headers()
@@ -164,13 +219,46 @@ class WebHandler(BaseHTTPRequestHandler):
                 self.send_response(200 if success else 404)
                 self.send_header("Content-type", "application/json; charset=utf-8")
                 self.end_headers()
-                self.wfile.write(json.dumps({"success": success}).encode())
+                self.wfile.write(_json_dumps({"success": success}))
                 return
 
         else:
             self.send_response(404)
             self.end_headers()
 
+    def _handle_status_stream(self):
+        """Stream process status via Server-Sent Events.
+
+        Sends a full 'snapshot' event on connect, then 'delta' events
+        containing only the processes whose fields changed since the
+        previous push. A full snapshot is resent when programs are
+        added or removed.
+        """
+        self.send_response(200)
+        self.send_header("Content-type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        last_sent = None
+        try:
+            while True:
+                status = self.manager.get_status()
+                current = {p["name"]: p for p in status}
+
+                if last_sent is None or set(current) != set(last_sent):
+                    # First push or program membership changed
+                    self.wfile.write(b"event: snapshot\ndata: " + _json_dumps(status) + b"\n\n")
+                else:
+                    deltas = [p for p in status if last_sent.get(p["name"]) != p]
+                    if deltas:
+                        self.wfile.write(b"event: delta\ndata: " + _json_dumps(deltas) + b"\n\n")
+
+                last_sent = current
+                self.wfile.flush()
+                time.sleep(2)
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass  # Client disconnected
+
     def _handle_upload(self):
         """Handle program upload via multipart form data."""
         try:
@@ -179,7 +267,7 @@ class WebHandler(BaseHTTPRequestHandler):
                 self.send_response(400)
                 self.send_header("Content-type", "application/json; charset=utf-8")
                 self.end_headers()
-                self.wfile.write(json.dumps({"success": False, "message": "Invalid content type"}).encode())
+                self.wfile.write(_json_dumps({"success": False, "message": "Invalid content type"}))
                 return
 
             # Parse multipart form data
@@ -208,7 +296,7 @@ class WebHandler(BaseHTTPRequestHandler):
                 self.send_response(400)
                 self.send_header("Content-type", "application/json; charset=utf-8")
                 self.end_headers()
-                self.wfile.write(json.dumps({"success": False, "message": "No ZIP file provided"}).encode())
+                self.wfile.write(_json_dumps({"success": False, "message": "No ZIP file provided"}))
                 return
 
             zip_data = files['zipfile']['data']
@@ -218,7 +306,7 @@ class WebHandler(BaseHTTPRequestHandler):
                 self.send_response(400)
                 self.send_header("Content-type", "application/json; charset=utf-8")
                 self.end_headers()
-                self.wfile.write(json.dumps({"success": False, "message": "Name and script are required"}).encode())
+                self.wfile.write(_json_dumps({"success": False, "message": "Name and script are required"}))
                 return
 
             # Upload program
@@ -227,13 +315,13 @@ class WebHandler(BaseHTTPRequestHandler):
             self.send_response(200 if result["success"] else 400)
             self.send_header("Content-type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+            self.wfile.write(_json_dumps(result))
 
         except Exception as e:
             self.send_response(500)
             self.send_header("Content-type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps({"success": False, "message": f"Upload error: {str(e)}"}).encode())
+            self.wfile.write(_json_dumps({"success": False, "message": f"Upload error: {str(e)}"}))
 
     def _handle_update(self, name: str):
         """Handle program update via multipart form data."""
@@ -243,7 +331,7 @@ class WebHandler(BaseHTTPRequestHandler):
                 self.send_response(400)
                 self.send_header("Content-type", "application/json; charset=utf-8")
                 self.end_headers()
-                self.wfile.write(json.dumps({"success": False, "message": "Invalid content type"}).encode())
+                self.wfile.write(_json_dumps({"success": False, "message": "Invalid content type"}))
                 return
 
             # Parse multipart form data
@@ -259,7 +347,7 @@ class WebHandler(BaseHTTPRequestHandler):
                 self.send_response(400)
                 self.send_header("Content-type", "application/json; charset=utf-8")
                 self.end_headers()
-                self.wfile.write(json.dumps({"success": False, "message": "No ZIP file provided"}).encode())
+                self.wfile.write(_json_dumps({"success": False, "message": "No ZIP file provided"}))
                 return
 
             zip_data = files['zipfile']['data']
@@ -270,13 +358,13 @@ class WebHandler(BaseHTTPRequestHandler):
             self.send_response(200 if result["success"] else 400)
             self.send_header("Content-type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+            self.wfile.write(_json_dumps(result))
 
         except Exception as e:
             self.send_response(500)
             self.send_header("Content-type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps({"success": False, "message": f"Update error: {str(e)}"}).encode())
+            self.wfile.write(_json_dumps({"success": False, "message": f"Update error: {str(e)}"}))
 
     def _handle_edit(self, name: str):
         """Handle program configuration edit via JSON body."""
@@ -290,17 +378,17 @@ class WebHandler(BaseHTTPRequestHandler):
             self.send_response(200 if result["success"] else 400)
             self.send_header("Content-type", "application/json; charset=utf-8")
             self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+            self.wfile.write(_json_dumps(result))
         except json.JSONDecodeError:
             self.send_response(400)
             self.send_header("Content-type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps({"success": False, "message": "Invalid JSON"}).encode())
+            self.wfile.write(_json_dumps({"success": False, "message": "Invalid JSON"}))
         except Exception as e:
             self.send_response(500)
             self.send_header("Content-type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps({"success": False, "message": str(e)}).encode())
+            self.wfile.write(_json_dumps({"success": False, "message": str(e)}))
 
     def _handle_add(self):
         """Handle adding a new program via JSON body."""
@@ -317,14 +405,14 @@ class WebHandler(BaseHTTPRequestHandler):
                 self.send_response(400)
                 self.send_header("Content-type", "application/json")
                 self.end_headers()
-                self.wfile.write(json.dumps({"success": False, "message": "Name is required"}).encode())
+                self.wfile.write(_json_dumps({"success": False, "message": "Name is required"}))
                 return
 
             if not script and not module:
                 self.send_response(400)
                 self.send_header("Content-type", "application/json")
                 self.end_headers()
-                self.wfile.write(json.dumps({"success": False, "message": "Either script or module is required"}).encode())
+                self.wfile.write(_json_dumps({"success": False, "message": "Either script or module is required"}))
                 return
 
             result = self.manager.add_program(
@@ -343,14 +431,14 @@ class WebHandler(BaseHTTPRequestHandler):
             self.send_response(200 if result["success"] else 400)
             self.send_header("Content-type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+            self.wfile.write(_json_dumps(result))
         except json.JSONDecodeError:
             self.send_response(400)
             self.send_header("Content-type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps({"success": False, "message": "Invalid JSON"}).encode())
+            self.wfile.write(_json_dumps({"success": False, "message": "Invalid JSON"}))
         except Exception as e:
             self.send_response(500)
             self.send_header("Content-type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps({"success": False, "message": str(e)}).encode())
+            self.wfile.write(_json_dumps({"success": False, "message": str(e)}))
@@ -10,8 +10,9 @@ the Free Software Foundation, either version 3 of the License, or
 """
 
 
-def get_html(title: str = "Process Manager") -> str:
-    html = """<!DOCTYPE html>
+import gzip
+
+_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -109,6 +110,10 @@ def get_html(title: str = "Process Manager") -> str:
             transition: all 0.3s ease;
             position: relative;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+            /* Isolate each card's layout/paint and skip rendering offscreen rows */
+            contain: content;
+            content-visibility: auto;
+            contain-intrinsic-size: 0 180px;
         }
         .process:hover {
             background: rgba(13, 20, 33, 0.85);
@@ -213,8 +218,12 @@ def get_html(title: str = "Process Manager") -> str:
             width: 100%;
             height: 35px;
             opacity: 0.8;
+            contain: strict;
+            will-change: contents;  /* own compositor layer: sparkline updates repaint only this texture */
         }
         .cpu-chart-mini svg { display: block; width: 100%; height: 100%; }
+        .table-spark { contain: strict; will-change: contents; }
+        .table-spark svg { display: block; width: 100%; height: 100%; }
 
         .process-actions {
             display: flex;
@@ -405,6 +414,8 @@ def get_html(title: str = "Process Manager") -> str:
             flex-direction: column;
             border: 1px solid rgba(0, 212, 255, 0.2);
             box-shadow: 0 8px 32px rgba(0, 0, 0, 0.5), 0 0 60px rgba(0, 212, 255, 0.1);
+            contain: layout paint;
+            will-change: transform;
         }
         .modal-header {
             padding: 18px 25px;
@@ -427,7 +438,7 @@ def get_html(title: str = "Process Manager") -> str:
         .modal-controls .tail-btn.active { background: linear-gradient(135deg, #e65100, #bf360c); }
         .modal-info { color: #888; font-size: 0.85em; margin-left: auto; }
         .modal-body { flex: 1; overflow: auto; padding: 0; }
-        .log-content { font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace; font-size: 12px; line-height: 1.5; white-space: pre-wrap; word-wrap: break-word; padding: 20px; margin: 0; background: rgba(13, 20, 33, 0.8); color: #e0e0e0; min-height: 100%; }
+        .log-content { font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace; font-size: 12px; line-height: 1.5; white-space: pre-wrap; word-wrap: break-word; padding: 20px; margin: 0; background: rgba(13, 20, 33, 0.8); color: #e0e0e0; min-height: 100%; contain: layout style; }
         .log-loading { color: #888; padding: 20px; text-align: center; }
 
         /* Upload Modal Styles */
@@ -664,55 +675,126 @@ def get_html(title: str = "Process Manager") -> str:
         let currentOffset = 0;
         let linesPerPage = 200;
         let totalLines = 0;
-        let tailInterval = null;
-
-        function getCPUColor(data) {
-            if (!data || data.length === 0) return '#4caf50';
-            const displayData = data.slice(-300);
-            const avg = displayData.reduce((a, b) => a + b, 0) / displayData.length;
+        let tailRunning = false;
+        let logReqId = 0;
+        let logAbort = null;
+
+        // Hot-path elements resolved once; the script runs after the DOM exists
+        const $processes = document.getElementById('processes');
+        const $headerStatus = document.getElementById('headerStatus');
+        const $logModal = document.getElementById('logModal');
+        const $logModalTitle = document.getElementById('logModalTitle');
+        const $logContent = document.getElementById('logContent');
+        const $logInfo = document.getElementById('logInfo');
+        const $btnOlder = document.getElementById('btnOlder');
+        const $btnNewer = document.getElementById('btnNewer');
+        const $btnTail = document.getElementById('btnTail');
+
+        function debounce(fn, delay) {
+            let timer = null;
+            return (...args) => {
+                clearTimeout(timer);
+                timer = setTimeout(() => fn(...args), delay);
+            };
+        }
+
+        function getCPUColor(buf, len) {
+            if (!len) return '#4caf50';
+            let sum = 0;
+            for (let i = 0; i < len; i++) sum += buf[i];
+            const avg = sum / len;
             if (avg > 80) return '#f44336';
             if (avg > 50) return '#ff9800';
             return '#4caf50';
         }
 
-        function renderSparkline(data, width = 400, height = 60) {
-            if (!data || data.length === 0) {
-                return `<svg viewBox="0 0 ${width} ${height}" preserveAspectRatio="none"></svg>`;
+        const SVG_NS = 'http://www.w3.org/2000/svg';
+
+        // One persistent <svg> with two <polyline> elements per chart;
+        // refreshes only rewrite the points/color attributes instead of
+        // reparsing a full SVG string each tick
+        function createSparkline(container, width, height) {
+            const svg = document.createElementNS(SVG_NS, 'svg');
+            svg.setAttribute('viewBox', `0 0 ${width} ${height}`);
+            svg.setAttribute('preserveAspectRatio', 'none');
+            svg.style.cssText = 'display: block; width: 100%; height: 100%;';
+            const area = document.createElementNS(SVG_NS, 'polyline');
+            area.setAttribute('fill-opacity', '0.15');
+            const line = document.createElementNS(SVG_NS, 'polyline');
+            line.setAttribute('fill', 'none');
+            line.setAttribute('stroke-width', '1.2');
+            line.setAttribute('stroke-linejoin', 'round');
+            svg.appendChild(area);
+            svg.appendChild(line);
+            container.appendChild(svg);
+            return { area, line, width, height, lastPoints: '' };
+        }
+
+        function updateSparkline(spark, buf, len) {
+            if (!len) {
+                if (spark.lastPoints !== '') {
+                    spark.lastPoints = '';
+                    spark.area.removeAttribute('points');
+                    spark.line.removeAttribute('points');
+                }
+                return;
             }
 
+            const width = spark.width;
+            const height = spark.height;
             const padding = 1;
-            const maxVal = Math.max(...data, 10);
+            let maxVal = 10;
+            for (let i = 0; i < len; i++) {
+                if (buf[i] > maxVal) maxVal = buf[i];
+            }
 
-            // Decimate data to match display width for a cleaner "finer" line
-            let displayData = data.slice(-300);
-            if (displayData.length > width) {
-                const sampled = [];
-                const bucketSize = displayData.length / width;
+            // Decimate data to match display width for a cleaner "finer"
+            // line, bucketing by max for visibility of spikes. The bucket
+            // buffer is preallocated once per chart
+            let displayData = buf;
+            let displayLen = len;
+            if (len > width) {
+                const sampled = spark.buckets || (spark.buckets = new Float32Array(width));
+                const bucketSize = len / width;
                 for (let i = 0; i < width; i++) {
                     const start = Math.floor(i * bucketSize);
-                    const end = Math.floor((i + 1) * bucketSize);
-                    const slice = displayData.slice(start, Math.max(start + 1, end));
-                    sampled.push(Math.max(...slice)); // Use max for visibility of spikes
+                    const end = Math.max(start + 1, Math.floor((i + 1) * bucketSize));
+                    let m = buf[start];
+                    for (let j = start + 1; j < end; j++) {
+                        if (buf[j] > m) m = buf[j];
+                    }
+                    sampled[i] = m;
                 }
                 displayData = sampled;
+                displayLen = width;
             }
 
-            const stepX = width / Math.max(displayData.length - 1, 1);
-            const points = displayData.map((val, i) => {
-                const x = i * stepX;
-                const y = height - padding - ((val / maxVal) * (height - padding * 2));
-                return `${x},${y}`;
-            });
+            const stepX = width / Math.max(displayLen - 1, 1);
+            const yBase = height - padding;
+            const yScale = (height - padding * 2) / maxVal;
+            // Quantize y to one decimal and drop interior points of flat
+            // runs - the polyline looks identical with only the endpoints,
+            // and idle (0%) processes collapse to a handful of points
+            const ys = spark.ys || (spark.ys = new Float32Array(width));
+            for (let i = 0; i < displayLen; i++) {
+                ys[i] = Math.round((yBase - displayData[i] * yScale) * 10) / 10;
+            }
+            const points = [];
+            for (let i = 0; i < displayLen; i++) {
+                if (i > 0 && i < displayLen - 1 && ys[i] === ys[i - 1] && ys[i] === ys[i + 1]) continue;
+                points.push(`${i * stepX},${ys[i]}`);
+            }
 
             const polylinePoints = points.join(' ');
+            if (polylinePoints === spark.lastPoints) return;
+            spark.lastPoints = polylinePoints;
             const areaPoints = `${points[0].split(',')[0]},${height} ${polylinePoints} ${points[points.length-1].split(',')[0]},${height}`;
 
-            const color = getCPUColor(data);
-
-            return `<svg viewBox="0 0 ${width} ${height}" preserveAspectRatio="none" style="display: block; width: 100%; height: 100%;">
-                <polyline fill="${color}" fill-opacity="0.15" points="${areaPoints}"/>
-                <polyline fill="none" stroke="${color}" stroke-width="1.2" stroke-linejoin="round" points="${polylinePoints}"/>
-            </svg>`;
+            const color = getCPUColor(buf, len);
+            spark.area.setAttribute('fill', color);
+            spark.area.setAttribute('points', areaPoints);
+            spark.line.setAttribute('stroke', color);
+            spark.line.setAttribute('points', polylinePoints);
         }
 
         const ICONS = {
@@ -727,27 +809,133 @@ def get_html(title: str = "Process Manager") -> str:
             reset: '<svg viewBox="0 0 24 24"><path d="M12 5V1L7 6l5 5V7c3.31 0 6 2.69 6 6s-2.69 6-6 6-6-2.69-6-6H4c0 4.42 3.58 8 8 8s8-3.58 8-8-3.58-8-8-8z"/></svg>'
         };
 
+        let lastProcesses = [];
+        let pollInterval = null;
+
+        let statusInFlight = false;
+        let statusAbort = null;
+
         async function fetchStatus() {
+            // Skip the tick if the previous request is still pending so a
+            // stalled server can't pile up concurrent fetches and renders
+            if (statusInFlight) return;
+            statusInFlight = true;
+            statusAbort = new AbortController();
             try {
-                const res = await fetch('/api/status');
+                const res = await fetch('/api/status', { signal: statusAbort.signal });
                 const data = await res.json();
+                lastProcesses = data;
                 render(data);
             } catch (e) {
                 console.error('Failed to fetch status:', e);
+            } finally {
+                statusInFlight = false;
             }
         }
 
-        function render(processes) {
-            const container = document.getElementById('processes');
+        function startPolling() {
+            if (pollInterval) return;
+            fetchStatus();
+            // Skip ticks while the tab is hidden; visibilitychange below
+            // refreshes immediately when it becomes visible again
+            pollInterval = setInterval(() => {
+                if (!document.hidden) fetchStatus();
+            }, 2000);
+        }
+
+        document.addEventListener('visibilitychange', () => {
+            if (!document.hidden) {
+                fetchStatus();
+                if (tailRunning && currentOffset === 0) loadLogs();
+            }
+        });
 
-            // Card view (existing)
-            const cardHtml = processes.map(p => `
+        function startStatusStream() {
+            if (!window.EventSource) {
+                startPolling();
+                return;
+            }
+            const es = new EventSource('/api/status/stream');
+            es.addEventListener('snapshot', e => {
+                lastProcesses = JSON.parse(e.data);
+                render(lastProcesses);
+            });
+            es.addEventListener('delta', e => {
+                const deltas = JSON.parse(e.data);
+                for (const d of deltas) {
+                    const i = lastProcesses.findIndex(p => p.name === d.name);
+                    if (i >= 0) Object.assign(lastProcesses[i], d);
+                }
+                render(lastProcesses);
+            });
+            es.onerror = () => {
+                // Stream dropped - fall back to plain polling
+                es.close();
+                startPolling();
+            };
+        }
+
+        // Keyed row cache: process name -> cached card/row elements plus the
+        // sub-elements patched each tick. Rows are created once and updated
+        // in place, so a refresh touches only the text/attributes that
+        // actually changed instead of reparsing the whole container.
+        const rowCache = new Map();
+        let tableEl = null;
+        let tableBodyEl = null;
+        let lastRowOrder = '';
+        let pendingProcesses = null;  // Latest snapshot awaiting the next frame
+
+        function cardFooterHtml(p) {
+            return `
+                <div class="action-group">
+                    <button class="btn btn-logs" data-action="logs" title="Logs">${ICONS.logs} <span class="btn-text">Logs</span></button>
+                    <button class="btn btn-edit" data-action="edit" title="Edit">${ICONS.edit} <span class="btn-text">Edit</span></button>
+                    <button class="btn btn-remove" data-action="remove" ${p.status !== 'stopped' ? 'disabled' : ''} title="Remove">${ICONS.remove} <span class="btn-text">Remove</span></button>
+                </div>
+                <div class="action-group">
+                    <button class="btn btn-restart" data-action="restart" ${p.status === 'stopping' || p.status === 'restarting' ? 'disabled' : ''} title="Restart">${ICONS.restart} <span class="btn-text">Restart</span></button>
+                    ${p.status === 'stopped' || p.is_broken ?
+                        `<button class="btn btn-start" data-action="start" title="Start">${ICONS.start} <span class="btn-text">Start</span></button>` :
+                        `<button class="btn btn-stop" data-action="stop" ${p.status === 'stopping' ? 'disabled' : ''} title="Stop">${ICONS.stop} <span class="btn-text">Stop</span></button>`}
+                </div>`;
+        }
+
+        function tableActionsHtml(p) {
+            return `
+                <div class="actions">
+                    ${p.status === 'stopped' || p.is_broken ?
+                        `<button class="btn btn-start" data-action="start" title="Start">${ICONS.start}</button>` :
+                        `<button class="btn btn-stop" data-action="stop" ${p.status === 'stopping' ? 'disabled' : ''} title="Stop">${ICONS.stop}</button>`}
+                    <button class="btn btn-restart" data-action="restart" ${p.status === 'stopping' || p.status === 'restarting' ? 'disabled' : ''} title="Restart">${ICONS.restart}</button>
+                    <button class="btn btn-logs" data-action="logs" title="Logs">${ICONS.logs}</button>
+                    <button class="btn btn-edit" data-action="edit" title="Edit">${ICONS.edit}</button>
+                    <button class="btn btn-remove" data-action="remove" ${p.status !== 'stopped' ? 'disabled' : ''} title="Remove">${ICONS.remove}</button>
+                </div>`;
+        }
+
+        function cardRestartsHtml(p) {
+            return `${p.total_restarts} ${p.total_restarts > 0 ? `<span class="reset-icon" data-action="reset" title="Reset counter">${ICONS.reset}</span>` : ''}`;
+        }
+
+        function tableRestartsHtml(p) {
+            return `${p.total_restarts || 0}${p.is_broken ? ` (${p.consecutive_failures} fails)` : ''} ${p.total_restarts > 0 ? `<span class="reset-icon" data-action="reset" title="Reset counter">${ICONS.reset}</span>` : ''}`;
+        }
+
+        // Fields baked into the static row markup; if any change (program
+        // edited), the cached row is discarded and rebuilt
+        function staticSig(p) {
+            return `${p.script}|${p.module}|${p.type}|${p.comment}`;
+        }
+
+        function buildEntry(p) {
+            const cardTpl = document.createElement('template');
+            cardTpl.innerHTML = `
                 <div class="process">
                     <div class="process-top">
                         <div class="process-title-group">
-                            <div class="process-name" title="${p.name}">${p.name}</div>
-                            <div class="process-script">${p.module ? '-m ' + p.module : p.script || '(none)'}<span class="type-badge ${p.type || 'python'}">${p.type || 'python'}</span></div>
-                            ${p.comment ? `<div class="process-comment">${p.comment}</div>` : ''}
+                            <div class="process-name"></div>
+                            <div class="process-script"><span class="type-badge ${p.type || 'python'}">${p.type || 'python'}</span></div>
+                            ${p.comment ? `<div class="process-comment"></div>` : ''}
                         </div>
                         <span class="status ${p.status}">${p.status}</span>
                     </div>
@@ -764,7 +952,7 @@ def get_html(title: str = "Process Manager") -> str:
                             </div>
                             <div class="stat-item">
                                 <span class="stat-label">Restarts</span>
-                                <span class="stat-value">${p.total_restarts} ${p.total_restarts > 0 ? `<span class="reset-icon" onclick="resetRestarts('${p.name}')" title="Reset counter">${ICONS.reset}</span>` : ''}</span>
+                                <span class="stat-value">${cardRestartsHtml(p)}</span>
                             </div>
                             <div class="stat-item">
                                 <span class="stat-label">Log</span>
@@ -772,86 +960,244 @@ def get_html(title: str = "Process Manager") -> str:
                             </div>
                         </div>
                         <div class="cpu-group">
-                            <div class="cpu-val-display" style="color: ${getCPUColor(p.cpu_history)}">${p.cpu_current.toFixed(1)}%</div>
-                            <div class="cpu-chart-mini">${renderSparkline(p.cpu_history, 120, 35)}</div>
+                            <div class="cpu-val-display" style="color: #4caf50">${p.cpu_current.toFixed(1)}%</div>
+                            <div class="cpu-chart-mini"></div>
                         </div>
                     </div>
 
-                    <div class="process-footer">
-                        <div class="action-group">
-                            <button class="btn btn-logs" onclick="openLogModal('${p.name}')" title="Logs">${ICONS.logs} <span class="btn-text">Logs</span></button>
-                            <button class="btn btn-edit" onclick="openEditModal('${p.name}')" title="Edit">${ICONS.edit} <span class="btn-text">Edit</span></button>
-                            <button class="btn btn-remove" onclick="removeProgram('${p.name}')" ${p.status !== 'stopped' ? 'disabled' : ''} title="Remove">${ICONS.remove} <span class="btn-text">Remove</span></button>
-                        </div>
-                        <div class="action-group">
-                            <button class="btn btn-restart" onclick="action('restart', '${p.name}')" ${p.status === 'stopping' || p.status === 'restarting' ? 'disabled' : ''} title="Restart">${ICONS.restart} <span class="btn-text">Restart</span></button>
-                            ${p.status === 'stopped' || p.is_broken ?
-                                `<button class="btn btn-start" onclick="action('start', '${p.name}')" title="Start">${ICONS.start} <span class="btn-text">Start</span></button>` :
-                                `<button class="btn btn-stop" onclick="action('stop', '${p.name}')" ${p.status === 'stopping' ? 'disabled' : ''} title="Stop">${ICONS.stop} <span class="btn-text">Stop</span></button>`}
+                    <div class="process-footer">${cardFooterHtml(p)}</div>
+                </div>`;
+            const card = cardTpl.content.firstElementChild;
+            card.dataset.name = p.name;
+
+            // User-controlled strings go in via textContent, never markup -
+            // no HTML tokenization of names/scripts and no injection risk
+            const nameEl = card.querySelector('.process-name');
+            nameEl.textContent = p.name;
+            nameEl.title = p.name;
+            const scriptEl = card.querySelector('.process-script');
+            scriptEl.insertBefore(
+                document.createTextNode(p.module ? '-m ' + p.module : p.script || '(none)'),
+                scriptEl.firstChild);
+            if (p.comment) {
+                card.querySelector('.process-comment').textContent = p.comment;
+            }
+
+            const rowTpl = document.createElement('template');
+            rowTpl.innerHTML = `
+                <tr>
+                    <td><span class="table-name"></span><span class="type-badge ${p.type || 'python'}">${p.type || 'python'}</span></td>
+                    <td><span class="status ${p.status}">${p.status}</span></td>
+                    <td class="table-info">${p.pid || '-'}</td>
+                    <td class="table-info">${p.uptime || '-'}</td>
+                    <td class="table-info">${p.log_size_display || '-'}</td>
+                     <td>
+                        <div style="display: flex; align-items: center; gap: 10px;">
+                            <div class="table-spark" style="width: 100px; height: 24px; background: rgba(0,0,0,0.2); border-radius: 4px; overflow: hidden; flex-shrink: 0;"></div>
+                            <div class="table-cpuval" style="font-size: 0.9em; font-weight: 700; color: #4caf50; min-width: 50px;">
+                                ${p.cpu_current.toFixed(1)}%
+                            </div>
                         </div>
-                    </div>
-                </div>
-            `).join('');
-
-            // Table view (compact)
-            const tableHtml = `
-                <table class="process-table">
-                    <thead>
-                        <tr>
-                            <th>Name</th>
-                            <th>Status</th>
-                            <th>PID</th>
-                            <th>Uptime</th>
-                            <th>Log Size</th>
-                            <th>CPU</th>
-                            <th>Restarts</th>
-                            <th>Actions</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        ${processes.map(p => `
-                            <tr>
-                                <td><span class="table-name">${p.name}</span><span class="type-badge ${p.type || 'python'}">${p.type || 'python'}</span></td>
-                                <td><span class="status ${p.status}">${p.status}</span></td>
-                                <td class="table-info">${p.pid || '-'}</td>
-                                <td class="table-info">${p.uptime || '-'}</td>
-                                <td class="table-info">${p.log_size_display || '-'}</td>
-                                 <td>
-                                    <div style="display: flex; align-items: center; gap: 10px;">
-                                        <div style="width: 100px; height: 24px; background: rgba(0,0,0,0.2); border-radius: 4px; overflow: hidden; flex-shrink: 0;">
-                                            ${renderSparkline(p.cpu_history, 100, 24)}
-                                        </div>
-                                        <div style="font-size: 0.9em; font-weight: 700; color: ${getCPUColor(p.cpu_history)}; min-width: 50px;">
-                                            ${p.cpu_current.toFixed(1)}%
-                                        </div>
-                                    </div>
-                                </td>
-                                <td class="table-info">${p.total_restarts || 0}${p.is_broken ? ` (${p.consecutive_failures} fails)` : ''} ${p.total_restarts > 0 ? `<span class="reset-icon" onclick="resetRestarts('${p.name}')" title="Reset counter">${ICONS.reset}</span>` : ''}</td>
-                                 <td class="table-actions">
-                                    <div class="actions">
-                                        ${p.status === 'stopped' || p.is_broken ?
-                                            `<button class="btn btn-start" onclick="action('start', '${p.name}')" title="Start">${ICONS.start}</button>` :
-                                            `<button class="btn btn-stop" onclick="action('stop', '${p.name}')" ${p.status === 'stopping' ? 'disabled' : ''} title="Stop">${ICONS.stop}</button>`}
-                                        <button class="btn btn-restart" onclick="action('restart', '${p.name}')" ${p.status === 'stopping' || p.status === 'restarting' ? 'disabled' : ''} title="Restart">${ICONS.restart}</button>
-                                        <button class="btn btn-logs" onclick="openLogModal('${p.name}')" title="Logs">${ICONS.logs}</button>
-                                        <button class="btn btn-edit" onclick="openEditModal('${p.name}')" title="Edit">${ICONS.edit}</button>
-                                        <button class="btn btn-remove" onclick="removeProgram('${p.name}')" ${p.status !== 'stopped' ? 'disabled' : ''} title="Remove">${ICONS.remove}</button>
-                                    </div>
-                                </td>
-                            </tr>
-                        `).join('')}
-                    </tbody>
-                </table>
-            `;
-
-            container.innerHTML = cardHtml + tableHtml;
-
-            // Update header status
-            updateHeaderStatus(processes);
+                    </td>
+                    <td class="table-info">${tableRestartsHtml(p)}</td>
+                     <td class="table-actions">${tableActionsHtml(p)}</td>
+                </tr>`;
+            const row = rowTpl.content.firstElementChild;
+            row.dataset.name = p.name;
+            row.querySelector('.table-name').textContent = p.name;
+
+            const cardStats = card.querySelectorAll('.stat-value');
+            const rowCells = row.querySelectorAll('.table-info');
+            const cardSpark = createSparkline(card.querySelector('.cpu-chart-mini'), 120, 35);
+            const rowSpark = createSparkline(row.querySelector('.table-spark'), 100, 24);
+            return {
+                card, row,
+                staticSig: staticSig(p),
+                cardStatus: card.querySelector('.status'),
+                cardPid: cardStats[0],
+                cardUptime: cardStats[1],
+                cardRestarts: cardStats[2],
+                cardLog: cardStats[3],
+                cardCpuVal: card.querySelector('.cpu-val-display'),
+                cardSpark,
+                cardFooter: card.querySelector('.process-footer'),
+                rowStatus: row.querySelector('.status'),
+                rowPid: rowCells[0],
+                rowUptime: rowCells[1],
+                rowLog: rowCells[2],
+                rowRestarts: rowCells[3],
+                rowSpark,
+                rowCpuVal: row.querySelector('.table-cpuval'),
+                rowActions: row.querySelector('.table-actions'),
+                lastStatus: p.status,
+                lastBroken: p.is_broken,
+                lastRestarts: p.total_restarts,
+                lastFailures: p.consecutive_failures,
+                // Client-side rolling CPU history; status ticks only carry
+                // the newest sample plus a sequence number. A preallocated
+                // typed array keeps the per-tick path allocation-free
+                cpu: new Float32Array(300),
+                cpuLen: 0,
+                cpuSeq: 0
+            };
+        }
+
+        function pushCpuSample(c, value) {
+            if (c.cpuLen < 300) {
+                c.cpu[c.cpuLen++] = value;
+            } else {
+                c.cpu.copyWithin(0, 1);
+                c.cpu[299] = value;
+            }
+        }
+
+        function seedCpuHistory(c, name) {
+            fetch(`/api/cpu-history/${encodeURIComponent(name)}`)
+                .then(res => res.json())
+                .then(d => {
+                    if (d && d.history && d.seq >= c.cpuSeq) {
+                        const start = Math.max(0, d.history.length - 300);
+                        c.cpuLen = d.history.length - start;
+                        for (let i = 0; i < c.cpuLen; i++) {
+                            c.cpu[i] = d.history[start + i];
+                        }
+                        c.cpuSeq = d.seq;
+                    }
+                })
+                .catch(() => {});
+        }
+
+        function setText(el, value) {
+            const text = String(value);
+            if (el.textContent !== text) el.textContent = text;
+        }
+
+        function patchEntry(c, p) {
+            if (c.lastStatus !== p.status || c.lastBroken !== p.is_broken) {
+                c.cardStatus.className = 'status ' + p.status;
+                c.cardStatus.textContent = p.status;
+                c.rowStatus.className = 'status ' + p.status;
+                c.rowStatus.textContent = p.status;
+                // Button set/disabled state depends on status, rebuild those cells
+                c.cardFooter.innerHTML = cardFooterHtml(p);
+                c.rowActions.innerHTML = tableActionsHtml(p);
+            }
+            if (c.lastRestarts !== p.total_restarts || c.lastBroken !== p.is_broken
+                    || c.lastFailures !== p.consecutive_failures) {
+                c.cardRestarts.innerHTML = cardRestartsHtml(p);
+                c.rowRestarts.innerHTML = tableRestartsHtml(p);
+            }
+            c.lastStatus = p.status;
+            c.lastBroken = p.is_broken;
+            c.lastRestarts = p.total_restarts;
+            c.lastFailures = p.consecutive_failures;
+
+            setText(c.cardPid, p.pid || '-');
+            setText(c.rowPid, p.pid || '-');
+            setText(c.cardUptime, p.uptime || '-');
+            setText(c.rowUptime, p.uptime || '-');
+            setText(c.cardLog, p.log_size_display || '0 B');
+            setText(c.rowLog, p.log_size_display || '-');
+
+            if (p.cpu_seq !== c.cpuSeq) {
+                if (p.cpu_seq === c.cpuSeq + 1) {
+                    pushCpuSample(c, p.cpu_current);
+                } else {
+                    // First sight or missed ticks (reconnect) - reseed
+                    seedCpuHistory(c, p.name);
+                }
+                c.cpuSeq = p.cpu_seq;
+            }
+            const color = getCPUColor(c.cpu, c.cpuLen);
+            const cpuText = `${p.cpu_current.toFixed(1)}%`;
+            setText(c.cardCpuVal, cpuText);
+            c.cardCpuVal.style.color = color;
+            setText(c.rowCpuVal, cpuText);
+            c.rowCpuVal.style.color = color;
+            updateSparkline(c.cardSpark, c.cpu, c.cpuLen);
+            updateSparkline(c.rowSpark, c.cpu, c.cpuLen);
+        }
+
+        function render(processes) {
+            // Batch all DOM writes into one frame so layout/paint runs once.
+            // Coalesce: keep only the latest snapshot, so updates arriving
+            // while the tab is hidden (where rAF callbacks queue but never
+            // run) don't pile up one pending frame per tick.
+            const alreadyQueued = pendingProcesses !== null;
+            pendingProcesses = processes;
+            if (alreadyQueued) return;
+
+            requestAnimationFrame(() => {
+                const container = $processes;
+                processes = pendingProcesses;
+                pendingProcesses = null;
+                if (!tableEl) {
+                    container.innerHTML = `
+                        <table class="process-table">
+                            <thead>
+                                <tr>
+                                    <th>Name</th>
+                                    <th>Status</th>
+                                    <th>PID</th>
+                                    <th>Uptime</th>
+                                    <th>Log Size</th>
+                                    <th>CPU</th>
+                                    <th>Restarts</th>
+                                    <th>Actions</th>
+                                </tr>
+                            </thead>
+                            <tbody></tbody>
+                        </table>`;
+                    tableEl = container.querySelector('.process-table');
+                    tableBodyEl = tableEl.querySelector('tbody');
+                }
+
+                const names = new Set();
+                for (const p of processes) {
+                    names.add(p.name);
+                    let c = rowCache.get(p.name);
+                    if (c && c.staticSig !== staticSig(p)) {
+                        // Program was edited - rebuild its row from scratch
+                        c.card.remove();
+                        c.row.remove();
+                        rowCache.delete(p.name);
+                        c = null;
+                    }
+                    if (!c) {
+                        c = buildEntry(p);
+                        rowCache.set(p.name, c);
+                        container.insertBefore(c.card, tableEl);
+                        tableBodyEl.appendChild(c.row);
+                    }
+                    patchEntry(c, p);
+                }
+
+                // Drop rows for programs no longer present
+                for (const [name, c] of rowCache) {
+                    if (!names.has(name)) {
+                        c.card.remove();
+                        c.row.remove();
+                        rowCache.delete(name);
+                    }
+                }
+
+                // Restore ordering only when it actually changed
+                const order = processes.map(p => p.name).join('|');
+                if (order !== lastRowOrder) {
+                    lastRowOrder = order;
+                    for (const p of processes) {
+                        const c = rowCache.get(p.name);
+                        container.insertBefore(c.card, tableEl);
+                        tableBodyEl.appendChild(c.row);
+                    }
+                }
+
+                updateHeaderStatus(processes);
+            });
         }
 
         function updateHeaderStatus(processes) {
-            const header = document.getElementById('headerStatus');
+            const header = $headerStatus;
             const total = processes.length;
             const running = processes.filter(p => p.status === 'running').length;
             const broken = processes.filter(p => p.is_broken).length;
@@ -890,26 +1236,33 @@ def get_html(title: str = "Process Manager") -> str:
         function openLogModal(name) {
             currentLogProcess = name;
             currentOffset = 0;
-            document.getElementById('logModal').classList.add('active');
-            document.getElementById('logModalTitle').textContent = `Logs: ${name}`;
+            $logModal.classList.add('active');
+            $logModalTitle.textContent = `Logs: ${name}`;
             loadLogs();
         }
 
         function closeLogModal() {
-            document.getElementById('logModal').classList.remove('active');
+            $logModal.classList.remove('active');
             currentLogProcess = null;
             stopTail();
         }
 
         async function loadLogs() {
-            const content = document.getElementById('logContent');
-            const info = document.getElementById('logInfo');
+            const content = $logContent;
+            const info = $logInfo;
             content.textContent = 'Loading...';
 
+            // Abort any in-flight request so only the latest response renders
+            const reqId = ++logReqId;
+            if (logAbort) logAbort.abort();
+            logAbort = new AbortController();
+
             try {
-                const res = await fetch(`/api/logs/${encodeURIComponent(currentLogProcess)}?lines=${linesPerPage}&offset=${currentOffset}`);
+                const res = await fetch(`/api/logs/${encodeURIComponent(currentLogProcess)}?lines=${linesPerPage}&offset=${currentOffset}`, { signal: logAbort.signal });
                 const data = await res.json();
 
+                if (reqId !== logReqId) return;  // Stale response, a newer request won
+
                 if (data.error) {
                     content.textContent = `Error: ${data.error}`;
                     return;
@@ -919,31 +1272,39 @@ def get_html(title: str = "Process Manager") -> str:
                 content.textContent = data.content || '(empty log)';
                 info.textContent = `Lines ${data.start_line}-${data.end_line} of ${data.total_lines}`;
 
-                document.getElementById('btnOlder').disabled = !data.has_more;
-                document.getElementById('btnNewer').disabled = currentOffset === 0;
+                $btnOlder.disabled = !data.has_more;
+                $btnNewer.disabled = currentOffset === 0;
 
-                // Scroll to bottom when viewing latest logs
+                // Scroll to bottom when viewing latest logs. Defer the
+                // scrollHeight read to the next frame so it doesn't force
+                // a synchronous layout right after the textContent write
                 if (currentOffset === 0) {
-                    const body = document.querySelector('.modal-body');
-                    body.scrollTop = body.scrollHeight;
+                    requestAnimationFrame(() => {
+                        const body = document.querySelector('.modal-body');
+                        body.scrollTop = body.scrollHeight;
+                    });
                 }
             } catch (e) {
+                if (e.name === 'AbortError') return;
                 content.textContent = `Failed to load logs: ${e.message}`;
             }
         }
 
+        // Debounce rapid pagination clicks so mashing Older/Newer fires one request
+        const loadLogsDebounced = debounce(loadLogs, 50);
+
         function loadOlder() {
             currentOffset += linesPerPage;
             if (currentOffset > totalLines - linesPerPage) {
                 currentOffset = Math.max(0, totalLines - linesPerPage);
             }
-            loadLogs();
+            loadLogsDebounced();
         }
 
         function loadNewer() {
             currentOffset -= linesPerPage;
             if (currentOffset < 0) currentOffset = 0;
-            loadLogs();
+            loadLogsDebounced();
         }
 
         function refreshLogs() {
@@ -951,27 +1312,33 @@ def get_html(title: str = "Process Manager") -> str:
             loadLogs();
         }
 
+        async function tailLoop() {
+            while (tailRunning) {
+                if (!document.hidden && currentOffset === 0) {
+                    // Await the fetch so a slow response delays the next
+                    // tick instead of piling up concurrent requests
+                    await loadLogs();
+                }
+                await new Promise(resolve => setTimeout(resolve, 2000));
+            }
+        }
+
         function toggleTail() {
-            const btn = document.getElementById('btnTail');
-            if (tailInterval) {
+            const btn = $btnTail;
+            if (tailRunning) {
                 stopTail();
             } else {
-                tailInterval = setInterval(() => {
-                    if (currentOffset === 0) {
-                        loadLogs();
-                    }
-                }, 2000);
+                tailRunning = true;
+                tailLoop();
                 btn.textContent = 'Auto-refresh: ON';
                 btn.classList.add('active');
             }
         }
 
         function stopTail() {
-            if (tailInterval) {
-                clearInterval(tailInterval);
-                tailInterval = null;
-            }
-            const btn = document.getElementById('btnTail');
+            tailRunning = false;
+            if (logAbort) logAbort.abort();  // Cancel any in-flight log fetch
+            const btn = $btnTail;
             btn.textContent = 'Auto-refresh: OFF';
             btn.classList.remove('active');
         }
@@ -979,7 +1346,7 @@ def get_html(title: str = "Process Manager") -> str:
         // Close modal on Escape key
         document.addEventListener('keydown', (e) => {
             if (e.key === 'Escape') {
-                if (document.getElementById('logModal').classList.contains('active')) {
+                if ($logModal.classList.contains('active')) {
                     closeLogModal();
                 }
                 if (document.getElementById('editModal').classList.contains('active')) {
@@ -1386,9 +1753,46 @@ def get_html(title: str = "Process Manager") -> str:
             }
         })();
 
+        // One delegated click handler dispatches every per-row button via
+        // data-action, with the process name taken from the row element
+        document.getElementById('processes').addEventListener('click', e => {
+            const target = e.target.closest('[data-action]');
+            if (!target || target.disabled) return;
+            const holder = target.closest('[data-name]');
+            if (!holder) return;
+            const name = holder.dataset.name;
+            const act = target.dataset.action;
+            if (act === 'logs') openLogModal(name);
+            else if (act === 'edit') openEditModal(name);
+            else if (act === 'remove') removeProgram(name);
+            else if (act === 'reset') resetRestarts(name);
+            else action(act, name);
+        });
+
         fetchStatus();
-        setInterval(fetchStatus, 2000);
+        startStatusStream();
     </script>
 </body>
 </html>"""
-    return html.replace("{{TITLE}}", title)
+
+# Template split around {{TITLE}} once at import; rendering a page is then
+# a bytes join instead of a search/replace plus encode per request
+_HTML_PARTS = tuple(part.encode("utf-8") for part in _HTML.split("{{TITLE}}"))
+_page_cache = {}  # title -> (plain bytes, gzipped bytes)
+
+
+def get_html(title: str = "Process Manager") -> str:
+    return _HTML.replace("{{TITLE}}", title)
+
+
+def get_html_bytes(title: str = "Process Manager", gzipped: bool = False) -> bytes:
+    """Return the rendered page as bytes, optionally gzip-compressed.
+
+    Both forms are built once per title and cached, so serving the page
+    is a single write of a preallocated bytes object."""
+    cached = _page_cache.get(title)
+    if cached is None:
+        body = title.encode("utf-8").join(_HTML_PARTS)
+        cached = (body, gzip.compress(body))
+        _page_cache[title] = cached
+    return cached[1] if gzipped else cached[0]